@@ -7,10 +7,9 @@ large directories and potential cleanup candidates.
 
 import os
 import fnmatch
-from tqdm import tqdm
 
 from directory_cleaner.directory_cleaner.core.file_utils import (
-    normalize_path, get_dir_size, format_size
+    normalize_path, get_dir_size, format_size, tqdm
 )
 
 
@@ -49,7 +48,7 @@ def analyze_disk_usage(directory, depth=3):
                     full_path = os.path.join(root, d)
                     full_path = normalize_path(full_path)
                     try:
-                        size = get_dir_size(full_path)
+                        size = get_dir_size(full_path, normalized=True)
                         results.append((full_path, size))
                     except Exception as e:
                         print(f"Error analyzing {full_path}: {e}")
@@ -103,7 +102,7 @@ def find_cleaning_opportunities(directory):
             if "node_modules" in dirs:
                 path = os.path.join(root, "node_modules")
                 path = normalize_path(path)
-                size = get_dir_size(path)
+                size = get_dir_size(path, normalized=True)
                 if size > 10 * 1024 * 1024:  # Only report if > 10MB
                     opportunities["node_modules"].append((path, size))
             
@@ -113,7 +112,7 @@ def find_cleaning_opportunities(directory):
                     if d == pattern or fnmatch.fnmatch(d, pattern):
                         path = os.path.join(root, d)
                         path = normalize_path(path)
-                        size = get_dir_size(path)
+                        size = get_dir_size(path, normalized=True)
                         if size > 5 * 1024 * 1024:  # Only report if > 5MB
                             opportunities["build_artifacts"].append((path, size))
             
@@ -123,7 +122,7 @@ def find_cleaning_opportunities(directory):
                     if d == pattern or fnmatch.fnmatch(d, pattern):
                         path = os.path.join(root, d)
                         path = normalize_path(path)
-                        size = get_dir_size(path)
+                        size = get_dir_size(path, normalized=True)
                         if size > 5 * 1024 * 1024:  # Only report if > 5MB
                             opportunities["cache_dirs"].append((path, size))
             
@@ -134,7 +133,7 @@ def find_cleaning_opportunities(directory):
                         path = os.path.join(root, d)
                         path = normalize_path(path)
                         if os.path.isdir(path):
-                            size = get_dir_size(path)
+                            size = get_dir_size(path, normalized=True)
                         else:
                             try:
                                 size = os.path.getsize(path)
@@ -153,7 +152,7 @@ def find_cleaning_opportunities(directory):
                 path = os.path.join(root, d)
                 path = normalize_path(path)
                 try:
-                    size = get_dir_size(path)
+                    size = get_dir_size(path, normalized=True)
                     if size > 100 * 1024 * 1024:  # Only report if > 100MB
                         all_dirs.append((path, size))
                 except Exception:
@@ -179,7 +178,8 @@ def find_cleaning_opportunities(directory):
 
 
 def delete_pattern_directories_multiple(directory, patterns, dry_run=False, exclude=None, older_than=None, 
-                               min_size=0, trash=False, interactive=False, parallel=False):
+                               min_size=0, trash=False, interactive=False, parallel=False,
+                               verbose=True):
     """Delete all directories matching any of the patterns recursively under the given directory."""
     from directory_cleaner.directory_cleaner.core.dir_operations import delete_directory
     
@@ -215,7 +215,7 @@ def delete_pattern_directories_multiple(directory, patterns, dry_run=False, excl
                 
                 # Import should_process within the function to avoid circular imports
                 from directory_cleaner.directory_cleaner.core.dir_operations import should_process
-                if should_process(full_path, exclude, older_than, min_size):
+                if should_process(full_path, exclude, older_than, min_size, normalized=True):
                     paths_to_delete.append(full_path)
                     # Avoid descending into directories we're going to delete
                     if d in dirs:  # Check if still in dirs (might have been removed already)
@@ -230,7 +230,7 @@ def delete_pattern_directories_multiple(directory, patterns, dry_run=False, excl
         with concurrent.futures.ThreadPoolExecutor() as executor:
             futures = []
             for path in paths_to_delete:
-                future = executor.submit(delete_directory, path, dry_run, trash, interactive)
+                future = executor.submit(delete_directory, path, dry_run, trash, interactive, verbose)
                 futures.append(future)
             
             for future, path in tqdm(zip(concurrent.futures.as_completed(futures), paths_to_delete), 
@@ -246,7 +246,7 @@ def delete_pattern_directories_multiple(directory, patterns, dry_run=False, excl
     else:
         # Sequential processing
         for path in tqdm(paths_to_delete, desc="Processing"):
-            size = delete_directory(path, dry_run, trash, interactive)
+            size = delete_directory(path, dry_run, trash, interactive, verbose)
             if size > 0:
                 count += 1
                 total_size_saved += size
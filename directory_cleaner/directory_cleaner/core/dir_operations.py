@@ -6,25 +6,47 @@ based on different criteria such as patterns, age, and size.
 """
 
 import os
+import re
 import fnmatch
+import stat
 import shutil
 import time
 import datetime
 import concurrent.futures
 from pathlib import Path
-from tqdm import tqdm
 
+try:
+    import send2trash
+except ImportError:
+    send2trash = None
+
+from directory_cleaner.directory_cleaner.core import size_cache
 from directory_cleaner.directory_cleaner.core.file_utils import (
-    normalize_path, get_dir_size, format_size, TRASH_SUPPORTED
+    normalize_path, get_dir_size, get_dir_size_at_least, format_size, TRASH_SUPPORTED,
+    tqdm
 )
 
 
-def should_process(path, exclude_patterns, older_than, min_size):
-    """Determine if a directory should be processed based on filters."""
-    path = normalize_path(path)
-    
-    # Check if path exists first
-    if not os.path.exists(path) or not os.path.isdir(path):
+def should_process(path, exclude_patterns, older_than, min_size, dir_fd=None,
+                   normalized=False):
+    """Determine if a directory should be processed based on filters.
+    
+    dir_fd may be an open descriptor of the directory containing path, in which
+    case path is stat'ed relative to it. Pass normalized=True if path has
+    already been through normalize_path.
+    """
+    if not normalized:
+        path = normalize_path(path)
+    
+    # Check if path exists first, keeping the stat result for the age check
+    try:
+        if dir_fd is None:
+            st = os.stat(path)
+        else:
+            st = os.stat(os.path.basename(path), dir_fd=dir_fd)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(st.st_mode):
         return False
         
     # Check exclusion patterns
@@ -35,18 +57,14 @@ def should_process(path, exclude_patterns, older_than, min_size):
     
     # Check age if specified
     if older_than is not None:
-        try:
-            mtime = os.path.getmtime(path)
-            age_days = (time.time() - mtime) / (24 * 3600)
-            if age_days < older_than:
-                return False
-        except OSError:
-            pass  # If we can't get mtime, don't filter by age
+        age_days = (time.time() - st.st_mtime) / (24 * 3600)
+        if age_days < older_than:
+            return False
     
-    # Check size if specified
+    # Check size if specified; the walk can stop as soon as min_size is reached
     if min_size > 0:
         try:
-            size = get_dir_size(path)
+            size = get_dir_size_at_least(path, min_size, normalized=True)
             if size < min_size:
                 return False
         except OSError:
@@ -55,8 +73,11 @@ def should_process(path, exclude_patterns, older_than, min_size):
     return True
 
 
-def delete_directory(path, dry_run=False, trash=False, interactive=False):
-    """Delete a directory with various options."""
+def delete_directory(path, dry_run=False, trash=False, interactive=False, verbose=True):
+    """Delete a directory with various options.
+    
+    With verbose False, nothing is printed for the directory unless it fails.
+    """
     # Normalize the path first
     path = normalize_path(path)
     
@@ -65,12 +86,13 @@ def delete_directory(path, dry_run=False, trash=False, interactive=False):
         print(f"✗ Cannot delete: {path} - Directory does not exist")
         return 0
     
-    size = get_dir_size(path)
+    size = get_dir_size(path, normalized=True)
     
     if interactive:
         response = input(f"Delete {path}? [y/N] ").lower()
         if response != 'y':
-            print(f"Skipping: {path}")
+            if verbose:
+                print(f"Skipping: {path}")
             return 0
     
     if not dry_run:
@@ -78,23 +100,27 @@ def delete_directory(path, dry_run=False, trash=False, interactive=False):
             if trash and TRASH_SUPPORTED:
                 # Path needs to be absolute for send2trash
                 absolute_path = os.path.abspath(path)
-                import send2trash
                 send2trash.send2trash(absolute_path)
-                print(f"✓ Moved to trash: {path} ({format_size(size)})")
+                if verbose:
+                    print(f"✓ Moved to trash: {path} ({format_size(size)})")
             else:
                 shutil.rmtree(path)
-                print(f"✓ Deleted: {path} ({format_size(size)})")
+                if verbose:
+                    print(f"✓ Deleted: {path} ({format_size(size)})")
+            size_cache.discard(path)
             return size
         except Exception as e:
             print(f"✗ Failed to delete {path}: {e}")
             return 0
     else:
-        print(f"Would delete: {path} ({format_size(size)})")
+        if verbose:
+            print(f"Would delete: {path} ({format_size(size)})")
         return size
 
 
 def delete_node_modules(directory, dry_run=False, exclude=None, older_than=None, 
-                        min_size=0, trash=False, interactive=False, parallel=False):
+                        min_size=0, trash=False, interactive=False, parallel=False,
+                        verbose=True):
     """Delete all node_modules folders recursively under the given directory."""
     # Normalize the directory path
     directory = normalize_path(directory)
@@ -113,11 +139,13 @@ def delete_node_modules(directory, dry_run=False, exclude=None, older_than=None,
     
     # First gather all node_modules paths
     try:
-        for root, dirs, files in os.walk(directory, topdown=False):
+        for root, dirs, files in os.walk(directory):
             if 'node_modules' in dirs:
+                # Nested node_modules go along with their parent, so don't descend
+                dirs.remove('node_modules')
                 node_modules_path = os.path.join(root, 'node_modules')
                 node_modules_path = normalize_path(node_modules_path)
-                if should_process(node_modules_path, exclude, older_than, min_size):
+                if should_process(node_modules_path, exclude, older_than, min_size, normalized=True):
                     paths_to_delete.append(node_modules_path)
     except (PermissionError, OSError) as e:
         print(f"Error accessing some directories: {e}")
@@ -128,7 +156,7 @@ def delete_node_modules(directory, dry_run=False, exclude=None, older_than=None,
         with concurrent.futures.ThreadPoolExecutor() as executor:
             futures = []
             for path in paths_to_delete:
-                future = executor.submit(delete_directory, path, dry_run, trash, interactive)
+                future = executor.submit(delete_directory, path, dry_run, trash, interactive, verbose)
                 futures.append(future)
             
             # Process results as they complete
@@ -145,7 +173,7 @@ def delete_node_modules(directory, dry_run=False, exclude=None, older_than=None,
     else:
         # Sequential processing
         for path in tqdm(paths_to_delete, desc="Processing"):
-            size = delete_directory(path, dry_run, trash, interactive)
+            size = delete_directory(path, dry_run, trash, interactive, verbose)
             if size > 0:
                 count += 1
                 total_size_saved += size
@@ -162,7 +190,8 @@ def delete_node_modules(directory, dry_run=False, exclude=None, older_than=None,
 
 
 def delete_subdirectories(folder_path, dry_run=False, exclude=None, older_than=None, 
-                         min_size=0, trash=False, interactive=False, parallel=False):
+                         min_size=0, trash=False, interactive=False, parallel=False,
+                         verbose=True):
     """Delete all subdirectories in the given folder."""
     # Normalize the folder path
     folder_path = normalize_path(folder_path)
@@ -184,7 +213,7 @@ def delete_subdirectories(folder_path, dry_run=False, exclude=None, older_than=N
         for item in os.listdir(folder_path):
             item_path = os.path.join(folder_path, item)
             item_path = normalize_path(item_path)
-            if os.path.isdir(item_path) and should_process(item_path, exclude, older_than, min_size):
+            if os.path.isdir(item_path) and should_process(item_path, exclude, older_than, min_size, normalized=True):
                 paths_to_delete.append(item_path)
     except (PermissionError, OSError) as e:
         print(f"Error accessing directory contents: {e}")
@@ -195,7 +224,7 @@ def delete_subdirectories(folder_path, dry_run=False, exclude=None, older_than=N
         with concurrent.futures.ThreadPoolExecutor() as executor:
             futures = []
             for path in paths_to_delete:
-                future = executor.submit(delete_directory, path, dry_run, trash, interactive)
+                future = executor.submit(delete_directory, path, dry_run, trash, interactive, verbose)
                 futures.append(future)
             
             for future, path in tqdm(zip(concurrent.futures.as_completed(futures), paths_to_delete), 
@@ -211,7 +240,7 @@ def delete_subdirectories(folder_path, dry_run=False, exclude=None, older_than=N
     else:
         # Sequential processing
         for path in tqdm(paths_to_delete, desc="Processing"):
-            size = delete_directory(path, dry_run, trash, interactive)
+            size = delete_directory(path, dry_run, trash, interactive, verbose)
             if size > 0:
                 count += 1
                 total_size_saved += size
@@ -228,7 +257,8 @@ def delete_subdirectories(folder_path, dry_run=False, exclude=None, older_than=N
 
 
 def delete_pattern_directories(directory, pattern, dry_run=False, exclude=None, older_than=None, 
-                               min_size=0, trash=False, interactive=False, parallel=False):
+                               min_size=0, trash=False, interactive=False, parallel=False,
+                               verbose=True):
     """Delete all directories matching a pattern recursively under the given directory."""
     # Normalize the directory path
     directory = normalize_path(directory)
@@ -252,7 +282,7 @@ def delete_pattern_directories(directory, pattern, dry_run=False, exclude=None,
             for d in matching_dirs:
                 full_path = os.path.join(root, d)
                 full_path = normalize_path(full_path)
-                if should_process(full_path, exclude, older_than, min_size):
+                if should_process(full_path, exclude, older_than, min_size, normalized=True):
                     paths_to_delete.append(full_path)
                     # Avoid descending into directories we're going to delete
                     dirs.remove(d)
@@ -265,7 +295,7 @@ def delete_pattern_directories(directory, pattern, dry_run=False, exclude=None,
         with concurrent.futures.ThreadPoolExecutor() as executor:
             futures = []
             for path in paths_to_delete:
-                future = executor.submit(delete_directory, path, dry_run, trash, interactive)
+                future = executor.submit(delete_directory, path, dry_run, trash, interactive, verbose)
                 futures.append(future)
             
             for future, path in tqdm(zip(concurrent.futures.as_completed(futures), paths_to_delete), 
@@ -281,7 +311,7 @@ def delete_pattern_directories(directory, pattern, dry_run=False, exclude=None,
     else:
         # Sequential processing
         for path in tqdm(paths_to_delete, desc="Processing"):
-            size = delete_directory(path, dry_run, trash, interactive)
+            size = delete_directory(path, dry_run, trash, interactive, verbose)
             if size > 0:
                 count += 1
                 total_size_saved += size
@@ -310,27 +340,61 @@ def find_empty_directories(directory, exclude=None):
     print(f"Scanning for empty directories in {directory}...")
     
     empty_dirs = []
-    
-    # Walk the directory tree from bottom up to identify empty directories
-    try:
-        for root, dirs, files in os.walk(directory, topdown=False):
+    empty_set = set()
+    
+    # Combine exclude patterns into a single regex so each directory costs one match
+    # (case-insensitive where fnmatch would be, i.e. on Windows)
+    excl_re = None
+    if exclude:
+        flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+        excl_re = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in exclude), flags)
+    
+    # Walk the directory tree with an explicit stack, finishing each directory only
+    # after its subdirectories (post-order) so they are listed before it. pending
+    # holds whether a directory being walked has non-directory entries, and its
+    # subdirectories.
+    pending = {}
+    stack = [(directory, False)]
+    while stack:
+        path, finished = stack.pop()
+        
+        if finished:
+            has_files, subdirs = pending.pop(path)
+            
             # Skip directories that match exclude patterns
-            if exclude and any(fnmatch.fnmatch(root, pattern) for pattern in exclude):
+            if excl_re and excl_re.match(path):
                 continue
-                
+            
             # Check if directory is empty (no files and no non-empty subdirectories)
-            if not files and not any(os.path.join(root, d) in empty_dirs for d in dirs):
+            if not has_files and all(d in empty_set for d in subdirs):
+                empty_set.add(path)
                 # Don't consider the root directory as an empty dir to delete
-                if root != directory:
-                    empty_dirs.append(root)
-    except (PermissionError, OSError) as e:
-        print(f"Error accessing some directories: {e}")
+                if path != directory:
+                    empty_dirs.append(path)
+            continue
+        
+        has_files = False
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    else:
+                        has_files = True
+        except OSError:
+            continue  # Unreadable directories are never considered empty
+        
+        pending[path] = (has_files, subdirs)
+        stack.append((path, True))
+        stack.extend((d, False) for d in subdirs)
     
     return empty_dirs
 
 
 def delete_empty_directories(directory, dry_run=False, exclude=None, older_than=None, 
-                         min_size=0, trash=False, interactive=False, parallel=False):
+                         min_size=0, trash=False, interactive=False, parallel=False,
+                         verbose=True):
     """Delete all empty directories recursively under the given directory."""
     # Normalize the directory path
     directory = normalize_path(directory)
@@ -355,7 +419,7 @@ def delete_empty_directories(directory, dry_run=False, exclude=None, older_than=
         with concurrent.futures.ThreadPoolExecutor() as executor:
             futures = []
             for path in empty_dirs:
-                future = executor.submit(delete_directory, path, dry_run, trash, interactive)
+                future = executor.submit(delete_directory, path, dry_run, trash, interactive, verbose)
                 futures.append(future)
             
             for future, path in tqdm(zip(concurrent.futures.as_completed(futures), empty_dirs), 
@@ -371,7 +435,7 @@ def delete_empty_directories(directory, dry_run=False, exclude=None, older_than=
     else:
         # Sequential processing
         for path in tqdm(empty_dirs, desc="Processing"):
-            size = delete_directory(path, dry_run, trash, interactive)
+            size = delete_directory(path, dry_run, trash, interactive, verbose)
             if size >= 0:  # Even if size is 0, consider it a success for empty dirs
                 count += 1
                 total_size_saved += size
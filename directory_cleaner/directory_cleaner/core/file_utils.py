@@ -7,14 +7,24 @@ including size calculations, path normalization, and format conversions.
 
 import os
 import re
+import stat
 from pathlib import Path
 
+from directory_cleaner.directory_cleaner.core import size_cache
+
 try:
     import send2trash
     TRASH_SUPPORTED = True
 except ImportError:
     TRASH_SUPPORTED = False
 
+try:
+    from tqdm import tqdm
+except ImportError:
+    def tqdm(iterable, **kwargs):
+        """Fallback when tqdm isn't installed: iterate without a progress bar."""
+        return iterable
+
 
 def normalize_path(path):
     """Normalize path for cross-platform compatibility."""
@@ -34,13 +44,27 @@ def normalize_path(path):
     return normalized
 
 
-def get_dir_size(path):
-    """Calculate the total size of a directory in bytes."""
-    path = normalize_path(path)
+def get_dir_size(path, normalized=False):
+    """Calculate the total size of a directory in bytes.
+    
+    Results are cached for the current operation, so a directory sized twice
+    is only walked once. Pass normalized=True if path has already been through
+    normalize_path.
+    """
+    if not normalized:
+        path = normalize_path(path)
     
     # Check if path exists before proceeding
-    if not os.path.exists(path) or not os.path.isdir(path):
+    try:
+        st = os.stat(path)
+    except OSError:
         return 0
+    if not stat.S_ISDIR(st.st_mode):
+        return 0
+    
+    cached_size = size_cache.get(path, st.st_mtime_ns)
+    if cached_size is not None:
+        return cached_size
         
     total_size = 0
     try:
@@ -55,6 +79,50 @@ def get_dir_size(path):
     except (PermissionError, OSError) as e:
         print(f"Warning: Couldn't access all files in {path}: {e}")
     
+    size_cache.put(path, st.st_mtime_ns, total_size)
+    return total_size
+
+
+def get_dir_size_at_least(path, threshold, normalized=False):
+    """Calculate the size of a directory in bytes, stopping once it reaches threshold.
+    
+    Returns the exact size if it is below threshold, otherwise some value of at
+    least threshold. Only complete sizes are stored in the size cache. Pass
+    normalized=True if path has already been through normalize_path.
+    """
+    if not normalized:
+        path = normalize_path(path)
+    
+    try:
+        st = os.stat(path)
+    except OSError:
+        return 0
+    if not stat.S_ISDIR(st.st_mode):
+        return 0
+    
+    cached_size = size_cache.get(path, st.st_mtime_ns)
+    if cached_size is not None:
+        return cached_size
+    
+    total_size = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass  # Skip entries that can't be accessed
+        except OSError:
+            continue
+        if total_size >= threshold:
+            return total_size
+    
+    size_cache.put(path, st.st_mtime_ns, total_size)
     return total_size
 
 
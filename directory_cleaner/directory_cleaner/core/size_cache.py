@@ -0,0 +1,52 @@
+"""
+In-memory cache of directory sizes.
+
+This module stores directory sizes calculated during a single operation so that
+a directory sized more than once is only walked once; cleanup discovery, for
+instance, sizes every candidate it finds by name and then again while looking
+for large directories. A directory's modification time only changes when its
+direct entries do, not when files deeper in the tree change, so the cache is
+cleared around every operation and never persisted.
+"""
+
+import os
+import threading
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def clear():
+    """Forget all cached sizes; called at the start and end of each operation."""
+    with _lock:
+        _cache.clear()
+
+
+def get(path, mtime_ns):
+    """Return the cached size for path if it was recorded at mtime_ns, else None."""
+    with _lock:
+        entry = _cache.get(path)
+    if entry and entry[0] == mtime_ns:
+        return entry[1]
+    return None
+
+
+def put(path, mtime_ns, size):
+    """Record the size of path as of mtime_ns."""
+    with _lock:
+        _cache[path] = (mtime_ns, size)
+
+
+def discard(path):
+    """Forget the cached sizes of path and the directories containing it, e.g.
+    after it has been deleted.
+    
+    Entries for directories inside path are left alone; they no longer exist, so
+    their mtime check can never match again.
+    """
+    with _lock:
+        _cache.pop(path, None)
+        parent = os.path.dirname(path)
+        while parent != path:
+            _cache.pop(parent, None)
+            path, parent = parent, os.path.dirname(parent)
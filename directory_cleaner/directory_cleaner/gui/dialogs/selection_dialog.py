@@ -30,8 +30,20 @@ class SelectionDialog(QDialog):
         self.items = items
         self.selected_items = []
         
+        # Parallel arrays so filtering doesn't re-lowercase every path per keystroke
+        self._paths_lower = [path.casefold() for path, _, _ in items]
+        self._categories = [category for _, _, category in items]
+        
         self.setWindowTitle("Select Items to Delete")
         self.resize(800, 600)
+        
+        # Coalesce path filter keystrokes so the table is only rebuilt
+        # once the user pauses typing
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.apply_filters)
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -71,7 +83,7 @@ class SelectionDialog(QDialog):
         
         # Connect filter signals
         self.category_combo.currentIndexChanged.connect(self.apply_filters)
-        self.filter_input.textChanged.connect(self.apply_filters)
+        self.filter_input.textChanged.connect(self._filter_timer.start)
         
         # Create table for items
         self.table = QTableWidget()
@@ -143,13 +155,18 @@ class SelectionDialog(QDialog):
         # Clear table
         self.table.setRowCount(0)
         
+        filter_text_cf = filter_text.casefold()
+        if filter_category == "All Categories":
+            filter_category = ""
+        
         # Add filtered items
-        for row, (path, size, category) in enumerate(self.items):
+        row = 0
+        for i, (path, size, category) in enumerate(self.items):
             # Apply filters
-            if filter_category and filter_category != "All Categories" and category != filter_category:
+            if filter_category and self._categories[i] != filter_category:
                 continue
                 
-            if filter_text and filter_text.lower() not in path.lower():
+            if filter_text_cf and filter_text_cf not in self._paths_lower[i]:
                 continue
                 
             # Add row
@@ -179,6 +196,8 @@ class SelectionDialog(QDialog):
             category_item = QTableWidgetItem(category)
             self.table.setItem(row, 3, category_item)
             
+            row += 1
+            
         # Update column sizes
         self.table.resizeColumnsToContents()
         self.table.setColumnWidth(1, max(300, self.table.columnWidth(1)))
@@ -8,8 +8,8 @@ import os
 import sys
 import json
 import webbrowser
-import platform
 import datetime
+from collections import deque
 from pathlib import Path
 
 from PyQt5.QtWidgets import (
@@ -19,16 +19,165 @@ from PyQt5.QtWidgets import (
     QFormLayout, QGridLayout, QFrame, QMessageBox, QTextBrowser, QSplitter,
     QDialog, QStyle  # Added QDialog and QStyle which were missing
 )
-from PyQt5.QtCore import Qt, QTimer, QDir
-from PyQt5.QtGui import QIcon, QFont, QPixmap, QTextCursor
+from PyQt5.QtCore import Qt, QTimer, QDir, QSignalMapper
+from PyQt5.QtGui import QIcon, QFont, QPixmap, QPixmapCache, QTextCursor
 
 from directory_cleaner.directory_cleaner.gui.dialogs.selection_dialog import SelectionDialog
-from directory_cleaner.directory_cleaner.services.worker import WorkerThread
+from directory_cleaner.directory_cleaner.services.worker import WorkerThread, shutdown_pool
 from directory_cleaner.directory_cleaner.core.file_utils import TRASH_SUPPORTED, format_size
 
+# User home directory and GUI settings file
+_HOME = os.path.expanduser("~")
+_CONFIG_FILE = Path(_HOME, ".dircleaner_config.json")
+
+# Project resources directory
+_ICONS_DIR = Path(__file__).resolve().parents[1] / "resources" / "icons"
+
+# Window icon, resolved once at import (None if no icon file is available)
+_ICON_CANDIDATES = (_ICONS_DIR / "cleaner_icon.ico",)
+_ICON_PATH = next((str(p) for p in _ICON_CANDIDATES if p.is_file()), None)
+
+# About dialog icon; the PNG is preferred for better quality, falling back to the ICO.
+# When the compiled Qt resource module is available the icon is loaded from memory.
+try:
+    from directory_cleaner.directory_cleaner.gui import resources_rc  # noqa: F401
+    _ABOUT_ICON_PATH = ":/icons/cleaner_icon.png"
+except ImportError:
+    _ABOUT_ICON_CANDIDATES = (_ICONS_DIR / "cleaner_icon.PNG", _ICONS_DIR / "cleaner_icon.ico")
+    _ABOUT_ICON_PATH = next((str(p) for p in _ABOUT_ICON_CANDIDATES if p.is_file()), None)
+
+# QPixmapCache key for the scaled About dialog icon
+_ABOUT_ICON_KEY = "about_icon_128"
+
+# Operations offered in the GUI as (label, worker operation name), in combo box order
+OPERATIONS = (
+    ("Delete Node Modules", "node_modules"),
+    ("Delete Subdirectories", "subdirs"),
+    ("Delete Empty Directories", "empty_dirs"),
+    ("Delete by Pattern", "pattern"),
+    ("Analyze Disk Usage", "analyze"),
+    ("Discover Cleanup Opportunities", "discover"),
+    ("Run Preset", "preset"),
+)
+
+# Maximum number of lines kept in the results log
+LOG_MAX_LINES = 10000
+
+# Application stylesheet, built once at import
+_APP_STYLESHEET = """
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+    QGroupBox {
+        border: 1px solid #bdbdbd;
+        border-radius: 4px;
+        margin-top: 1ex;
+        font-weight: bold;
+        background-color: #ffffff;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+        color: #1976d2;
+    }
+    QTabWidget::pane {
+        border: 1px solid #bdbdbd;
+        border-radius: 4px;
+        background-color: #ffffff;
+    }
+    QTabBar::tab {
+        background-color: #e0e0e0;
+        padding: 6px 15px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }
+    QTabBar::tab:selected {
+        background-color: #ffffff;
+        border: 1px solid #bdbdbd;
+        border-bottom-color: #ffffff;
+    }
+    QPushButton {
+        background-color: #2196f3;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 5px 15px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #1e88e5;
+    }
+    QPushButton:pressed {
+        background-color: #1976d2;
+    }
+    QPushButton:disabled {
+        background-color: #bdbdbd;
+    }
+    QLineEdit, QComboBox, QSpinBox {
+        border: 1px solid #bdbdbd;
+        border-radius: 4px;
+        padding: 5px;
+        background-color: white;
+    }
+    QTextEdit {
+        border: 1px solid #bdbdbd;
+        border-radius: 4px;
+        background-color: white;
+    }
+    QProgressBar {
+        border: 1px solid #bdbdbd;
+        border-radius: 4px;
+        background-color: #e0e0e0;
+        color: black;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        background-color: #2196f3;
+        border-radius: 3px;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QMenuBar {
+        background-color: #ffffff;
+    }
+    QMenuBar::item:selected {
+        background-color: #2196f3;
+        color: white;
+    }
+    QMenu {
+        background-color: #ffffff;
+        border: 1px solid #bdbdbd;
+    }
+    QMenu::item:selected {
+        background-color: #2196f3;
+        color: white;
+    }
+    #run_btn {
+        background-color: #4caf50;
+        min-height: 40px;
+        font-size: 15px;
+    }
+    #run_btn:hover {
+        background-color: #43a047;
+    }
+    #run_btn:pressed {
+        background-color: #388e3c;
+    }
+    #run_btn:disabled {
+        background-color: #bdbdbd;
+    }
+"""
+
 
 class MainWindow(QMainWindow):
     """Main application window"""
+    # About dialog text, built on first use and shared between windows
+    _about_html = None
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Directory Cleaner")
@@ -38,12 +187,8 @@ class MainWindow(QMainWindow):
         self.set_application_style()
         
         # Load icon if available, otherwise use default
-        # Updated path to point to the project resources directory
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
-                                "resources", "icons", "cleaner_icon.ico")
-        
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        if _ICON_PATH:
+            self.setWindowIcon(QIcon(_ICON_PATH))
         else:
             self.setWindowIcon(QIcon(self.style().standardIcon(QStyle.SP_TrashIcon)))
         
@@ -51,7 +196,16 @@ class MainWindow(QMainWindow):
         self.current_directory = None
         self.current_operation = None
         self.worker_thread = None
-        self.config_file = os.path.join(os.path.expanduser("~"), ".dircleaner_config.json")
+        # Ring buffer of log lines waiting to be shown; if the GUI falls far behind,
+        # the oldest lines are dropped, as the log view would trim them anyway
+        self._log_buffer = deque(maxlen=LOG_MAX_LINES)
+        
+        # Coalesce bursts of input changes into a single validation pass
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(50)
+        self._validate_timer.timeout.connect(self._do_validate)
+        self.config_file = _CONFIG_FILE
         
         # Load saved configuration
         self.load_config()
@@ -63,150 +217,76 @@ class MainWindow(QMainWindow):
         # Status bar
         self.statusBar = QStatusBar()
         self.setStatusBar(self.statusBar)
-        self.statusBar.showMessage("Ready")
+        # Status text goes through a permanent label, which repaints through the
+        # event loop instead of synchronously like showMessage()
+        self._statusbar_label = QLabel()
+        self.statusBar.addWidget(self._statusbar_label, 1)
+        self._statusbar_label.setText("Ready")
         
         # Connect signals
         self.connect_signals()
         
+        # Confirmation box reused for every interactive-mode prompt
+        self._confirm_box = QMessageBox(self)
+        self._confirm_box.setWindowTitle("Confirm Deletion")
+        self._confirm_box.setIcon(QMessageBox.Question)
+        self._confirm_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        self._confirm_box.setDefaultButton(QMessageBox.No)
+        # Make this dialog stay on top
+        self._confirm_box.setWindowFlags(self._confirm_box.windowFlags() | Qt.WindowStaysOnTopHint)
+        
+        # Long-lived worker that deletes items chosen in the selection dialog
+        self.selection_worker = WorkerThread()
+        self.selection_worker.log_update.connect(self._log_buffer.append)
+        self.selection_worker.progress_update.connect(self.update_progress)
+        self.selection_worker.operation_complete.connect(self.operation_completed)
+        self.selection_worker.confirmation_needed.connect(self.show_confirmation_dialog)
+        
     def set_application_style(self):
         """Set a modern style for the application"""
         # Set a modern blue-based color scheme
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QGroupBox {
-                border: 1px solid #bdbdbd;
-                border-radius: 4px;
-                margin-top: 1ex;
-                font-weight: bold;
-                background-color: #ffffff;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                color: #1976d2;
-            }
-            QTabWidget::pane {
-                border: 1px solid #bdbdbd;
-                border-radius: 4px;
-                background-color: #ffffff;
-            }
-            QTabBar::tab {
-                background-color: #e0e0e0;
-                padding: 6px 15px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: #ffffff;
-                border: 1px solid #bdbdbd;
-                border-bottom-color: #ffffff;
-            }
-            QPushButton {
-                background-color: #2196f3;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 5px 15px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1e88e5;
-            }
-            QPushButton:pressed {
-                background-color: #1976d2;
-            }
-            QPushButton:disabled {
-                background-color: #bdbdbd;
-            }
-            QLineEdit, QComboBox, QSpinBox {
-                border: 1px solid #bdbdbd;
-                border-radius: 4px;
-                padding: 5px;
-                background-color: white;
-            }
-            QTextEdit {
-                border: 1px solid #bdbdbd;
-                border-radius: 4px;
-                background-color: white;
-            }
-            QProgressBar {
-                border: 1px solid #bdbdbd;
-                border-radius: 4px;
-                background-color: #e0e0e0;
-                color: black;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #2196f3;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QMenuBar {
-                background-color: #ffffff;
-            }
-            QMenuBar::item:selected {
-                background-color: #2196f3;
-                color: white;
-            }
-            QMenu {
-                background-color: #ffffff;
-                border: 1px solid #bdbdbd;
-            }
-            QMenu::item:selected {
-                background-color: #2196f3;
-                color: white;
-            }
-            #run_btn {
-                background-color: #4caf50;
-                min-height: 40px;
-                font-size: 15px;
-            }
-            #run_btn:hover {
-                background-color: #43a047;
-            }
-            #run_btn:pressed {
-                background-color: #388e3c;
-            }
-            #run_btn:disabled {
-                background-color: #bdbdbd;
-            }
-        """)
-        
-        # Style the results text area
-        self.results_text_format = lambda message, color="black": f"<span style='color:{color};'>{message}</span><br>"
+        self.setStyleSheet(_APP_STYLESHEET)
         
     def load_config(self):
         """Load configuration from file"""
-        self.config = {
-            "last_directory": os.path.expanduser("~"),
-            "last_report_directory": os.path.expanduser("~")
+        defaults = {
+            "last_directory": _HOME,
+            "last_report_directory": _HOME
         }
+        self.config = defaults
+        self._config_dirty = False
         
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                    # Update config with loaded values
-                    self.config.update(loaded_config)
-                    
-                    # Validate that the last directory still exists
-                    if not os.path.exists(self.config["last_directory"]):
-                        self.config["last_directory"] = os.path.expanduser("~")
+            with open(self.config_file, 'r') as f:
+                loaded_config = json.load(f)
+            # Update config with loaded values
+            self.config = {**defaults, **loaded_config}
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading config: {e}")
     
+    def mark_config_dirty(self):
+        """Flag the configuration as changed; it is written out on close"""
+        self._config_dirty = True
+    
     def save_config(self):
-        """Save configuration to file"""
+        """Save configuration to file if it has changed"""
+        if not self._config_dirty:
+            return
+        
+        # Write to a temporary file and rename it over the config so a failed
+        # write never leaves a truncated config behind
+        tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f)
+            data = json.dumps(self.config, separators=(",", ":")).encode("utf-8")
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.config_file)
+            self._config_dirty = False
         except Exception as e:
             print(f"Error saving config: {e}")
         
@@ -243,15 +323,7 @@ class MainWindow(QMainWindow):
         op_group = QGroupBox("Operation")
         op_layout = QVBoxLayout()
         self.op_combo = QComboBox()
-        self.op_combo.addItems([
-            "Delete Node Modules",
-            "Delete Subdirectories",
-            "Delete Empty Directories",
-            "Delete by Pattern",
-            "Analyze Disk Usage",
-            "Discover Cleanup Opportunities",
-            "Run Preset"
-        ])
+        self.op_combo.addItems([label for label, _ in OPERATIONS])
         op_layout.addWidget(self.op_combo)
         op_group.setLayout(op_layout)
         left_layout.addWidget(op_group)
@@ -287,9 +359,11 @@ class MainWindow(QMainWindow):
         self.preset_layout.addWidget(self.preset_combo)
         
         # Add these layouts to the form (they'll be shown/hidden as needed)
+        self._pattern_label = QLabel("Pattern:")
+        self._preset_label = QLabel("Preset:")
         self.operation_form = QFormLayout()
-        self.operation_form.addRow("Pattern:", self.pattern_layout)
-        self.operation_form.addRow("Preset:", self.preset_layout)
+        self.operation_form.addRow(self._pattern_label, self.pattern_layout)
+        self.operation_form.addRow(self._preset_label, self.preset_layout)
         basic_layout.addLayout(self.operation_form)
         
         # Add a separator for visual clarity
@@ -322,6 +396,9 @@ class MainWindow(QMainWindow):
         self.parallel_cb = QCheckBox("Use parallel processing (faster)")
         checkbox_layout.addWidget(self.parallel_cb)
         
+        self.summary_only_cb = QCheckBox("Log summary only (hide per-item messages)")
+        checkbox_layout.addWidget(self.summary_only_cb)
+        
         self.selective_cb = QCheckBox("Selective mode (choose what to delete from scan results)")
         checkbox_layout.addWidget(self.selective_cb)
         
@@ -421,8 +498,18 @@ class MainWindow(QMainWindow):
         self.results_text = QTextEdit()
         self.results_text.setReadOnly(True)
         self.results_text.setPlaceholderText("Operation results will appear here...")
+        # The log is append-only, so skip undo history and cap its length to keep
+        # each append cheap on very large runs
+        self.results_text.setUndoRedoEnabled(False)
+        self.results_text.document().setMaximumBlockCount(LOG_MAX_LINES)
         results_layout.addWidget(self.results_text)
         
+        # Log messages are buffered and flushed to the text area in batches
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self.flush_log)
+        self._log_timer.start()
+        
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
@@ -431,6 +518,13 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         results_layout.addWidget(self.progress_bar)
         
+        # Worker progress is recorded as it arrives and applied to the bar at
+        # most once per frame while an operation is running
+        self._pending_progress = 0
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._apply_progress)
+        
         results_group.setLayout(results_layout)
         right_layout.addWidget(results_group)
         
@@ -468,10 +562,10 @@ class MainWindow(QMainWindow):
         self.update_ui_for_operation()
         
         # Set the last used directory if available
-        if self.config["last_directory"] and os.path.exists(self.config["last_directory"]):
+        if self.config["last_directory"]:
             self.dir_edit.setText(self.config["last_directory"])
             self.current_directory = self.config["last_directory"]
-            self.validate_input()  # Make sure the Run button is enabled if appropriate
+            self._do_validate()  # Make sure the Run button is enabled if appropriate
     
     def create_menu(self):
         """Create application menu"""
@@ -495,9 +589,14 @@ class MainWindow(QMainWindow):
         # Operations menu
         op_menu = menu_bar.addMenu("&Operations")
         
-        for i in range(self.op_combo.count()):
-            action = QAction(self.op_combo.itemText(i), self)
-            action.triggered.connect(lambda checked, idx=i: self.op_combo.setCurrentIndex(idx))
+        # Route every operation action through one mapper instead of a closure per item
+        self._op_mapper = QSignalMapper(self)
+        self._op_mapper.mapped[int].connect(self.op_combo.setCurrentIndex)
+        
+        for i, (label, _) in enumerate(OPERATIONS):
+            action = QAction(label, self)
+            self._op_mapper.setMapping(action, i)
+            action.triggered.connect(self._op_mapper.map)
             op_menu.addAction(action)
         
         # Help menu
@@ -514,6 +613,10 @@ class MainWindow(QMainWindow):
         self.pattern_input.textChanged.connect(self.validate_input)
     
     def validate_input(self):
+        """Schedule input validation; repeated calls within the interval are coalesced"""
+        self._validate_timer.start()
+    
+    def _do_validate(self):
         """Check if inputs are valid to enable the Run button"""
         # Basic directory check
         if not self.dir_edit.text():
@@ -521,8 +624,8 @@ class MainWindow(QMainWindow):
             return
             
         # Operation-specific checks
-        op_index = self.op_combo.currentIndex()
-        if op_index == 3:  # Delete by Pattern (index is 3)
+        operation = OPERATIONS[self.op_combo.currentIndex()][1]
+        if operation == "pattern":
             if not self.pattern_input.text():
                 self.run_btn.setEnabled(False)
                 return
@@ -532,29 +635,29 @@ class MainWindow(QMainWindow):
     
     def update_ui_for_operation(self):
         """Update UI components based on selected operation"""
-        op_index = self.op_combo.currentIndex()
+        operation = OPERATIONS[self.op_combo.currentIndex()][1]
         
-        # Hide all operation-specific controls first
-        for i in range(self.operation_form.rowCount()):
-            self.operation_form.itemAt(i, QFormLayout.LabelRole).widget().setVisible(False)
-            self.operation_form.itemAt(i, QFormLayout.FieldRole).layout().itemAt(0).widget().setVisible(False)
-        
-        # Show controls specific to the selected operation
-        if op_index == 3:  # Delete by Pattern (correct index is 3)
-            self.operation_form.itemAt(0, QFormLayout.LabelRole).widget().setVisible(True)
-            self.operation_form.itemAt(0, QFormLayout.FieldRole).layout().itemAt(0).widget().setVisible(True)
-        elif op_index == 6:  # Run Preset (correct index is 6)
-            self.operation_form.itemAt(1, QFormLayout.LabelRole).widget().setVisible(True)
-            self.operation_form.itemAt(1, QFormLayout.FieldRole).layout().itemAt(0).widget().setVisible(True)
+        # Show only the controls specific to the selected operation
+        show_pattern = operation == "pattern"
+        show_preset = operation == "preset"
+        self._pattern_label.setVisible(show_pattern)
+        self.pattern_input.setVisible(show_pattern)
+        self._preset_label.setVisible(show_preset)
+        self.preset_combo.setVisible(show_preset)
         
         # Validate inputs again
-        self.validate_input()
+        self._do_validate()
     
     def browse_directory(self):
         """Open directory browser dialog"""
+        # Only validate the remembered directory when the dialog is actually opened
+        start_directory = self.config["last_directory"]
+        if not os.path.isdir(start_directory):
+            start_directory = _HOME
+        
         directory = QFileDialog.getExistingDirectory(
             self, "Select Directory", 
-            self.config["last_directory"], 
+            start_directory, 
             QFileDialog.ShowDirsOnly
         )
         if directory:
@@ -563,7 +666,7 @@ class MainWindow(QMainWindow):
             
             # Save the selected directory for next time
             self.config["last_directory"] = directory
-            self.save_config()
+            self.mark_config_dirty()
     
     def browse_report_path(self):
         """Open file save dialog for the report path"""
@@ -580,7 +683,7 @@ class MainWindow(QMainWindow):
             
             # Save the report directory for next time
             self.config["last_report_directory"] = os.path.dirname(file_path)
-            self.save_config()
+            self.mark_config_dirty()
     
     def run_operation(self):
         """Run the selected operation with the specified options"""
@@ -601,6 +704,7 @@ class MainWindow(QMainWindow):
             "trash": self.trash_cb.isChecked() if TRASH_SUPPORTED else False,
             "interactive": self.interactive_cb.isChecked(),
             "parallel": self.parallel_cb.isChecked(),
+            "summary_only": self.summary_only_cb.isChecked(),
             "selective": self.selective_cb.isChecked()  # Add selective mode parameter
         }
         
@@ -625,30 +729,20 @@ class MainWindow(QMainWindow):
                 
                 # Save the report directory for next time
                 self.config["last_report_directory"] = os.path.dirname(report_file)
-                self.save_config()
+                self.mark_config_dirty()
             else:
                 # Create a timestamped report in last used report directory
                 timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
                 report_file = os.path.join(self.config["last_report_directory"], f"cleanup_report_{timestamp}.html")
                 params["report_path"] = report_file
         
-        # Map the operation to the actual function
-        if op_index == 0:  # Delete Node Modules
-            operation = "node_modules"
-        elif op_index == 1:  # Delete Subdirectories
-            operation = "subdirs"
-        elif op_index == 2:  # Delete Empty Directories
-            operation = "empty_dirs"
-        elif op_index == 3:  # Delete by Pattern
-            operation = "pattern"
+        # Map the operation to the worker operation and its extra parameters
+        operation = OPERATIONS[op_index][1]
+        if operation == "pattern":
             params["pattern"] = self.pattern_input.text()
-        elif op_index == 4:  # Analyze Disk Usage
-            operation = "analyze"
+        elif operation == "analyze":
             params["depth"] = self.depth_spin.value()
-        elif op_index == 5:  # Discover Cleanup Opportunities
-            operation = "discover"
-        elif op_index == 6:  # Run Preset
-            operation = "preset"
+        elif operation == "preset":
             params["preset_name"] = self.preset_combo.currentText()
         
         # Check for interactive and parallel mode conflict
@@ -661,41 +755,39 @@ class MainWindow(QMainWindow):
         if params.get("selective", False):
             # Create and start worker thread for scanning only
             self.worker_thread = WorkerThread(operation, **params)
-            self.worker_thread.log_update.connect(self.update_log)
+            self.worker_thread.log_update.connect(self._log_buffer.append)
             self.worker_thread.progress_update.connect(self.update_progress)
             self.worker_thread.scan_complete.connect(self.show_selection_dialog)
             
             # Clear results
-            self.results_text.clear()
+            self.clear_log()
             self.items_label.setText("0")
             self.space_label.setText("0 B")
             self.status_label.setText("Scanning...")
             self.open_report_btn.setVisible(False)
             
             # Show progress bar
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setValue(0)
+            self.start_progress()
             
             self.update_log(f"Scanning directory: {directory}")
-            self.statusBar.showMessage(f"Scanning for {operation_name}...")
+            self._statusbar_label.setText(f"Scanning for {operation_name}...")
             
             # Start scan operation
             self.worker_thread.scan_only(operation, **params)
         else:
             # Clear results
-            self.results_text.clear()
+            self.clear_log()
             self.items_label.setText("0")
             self.space_label.setText("0 B")
             self.status_label.setText("Running...")
             self.open_report_btn.setVisible(False)
             
             # Show progress bar
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setValue(0)
+            self.start_progress()
             
             # Create and start worker thread
             self.worker_thread = WorkerThread(operation, **params)
-            self.worker_thread.log_update.connect(self.update_log)
+            self.worker_thread.log_update.connect(self._log_buffer.append)
             self.worker_thread.progress_update.connect(self.update_progress)
             self.worker_thread.operation_complete.connect(self.operation_completed)
             
@@ -704,30 +796,59 @@ class MainWindow(QMainWindow):
                 self.worker_thread.confirmation_needed.connect(self.show_confirmation_dialog)
             
             self.worker_thread.start()
-            self.statusBar.showMessage(f"Running {operation_name}...")
+            self._statusbar_label.setText(f"Running {operation_name}...")
     
     def update_log(self, message):
-        """Update the log text with a new message"""
-        self.results_text.append(message)
+        """Queue a message for the log text; it is appended on the next flush"""
+        self._log_buffer.append(message)
+    
+    def flush_log(self):
+        """Append all buffered log messages to the log text at once"""
+        if not self._log_buffer:
+            return
+        self.results_text.append("\n".join(self._log_buffer))
+        self._log_buffer.clear()
         # Scroll to bottom
         self.results_text.moveCursor(QTextCursor.End)
     
+    def clear_log(self):
+        """Clear the log text and any messages still waiting to be flushed"""
+        self._log_buffer.clear()
+        self.results_text.clear()
+    
+    def start_progress(self):
+        """Show and reset the progress bar for a new operation"""
+        self._pending_progress = 0
+        self.progress_bar.setValue(0)
+        # The percentage text is only rendered once the operation finishes
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setVisible(True)
+        self._progress_timer.start()
+    
     def update_progress(self, progress):
-        """Update the progress bar"""
-        self.progress_bar.setValue(progress)
+        """Record the latest progress; the bar is updated on the next timer tick"""
+        self._pending_progress = progress
+    
+    def _apply_progress(self):
+        """Apply the latest recorded progress to the progress bar"""
+        if self._pending_progress != self.progress_bar.value():
+            self.progress_bar.setValue(self._pending_progress)
     
     def operation_completed(self, result):
         """Handle completion of an operation"""
+        self._progress_timer.stop()
+        self._pending_progress = 100
+        self.progress_bar.setTextVisible(True)
         self.progress_bar.setValue(100)
         
         # Update status
         if result.get("error"):
             self.status_label.setText("Error")
             self.update_log(f"Error: {result['error']}")
-            self.statusBar.showMessage("Operation failed")
+            self._statusbar_label.setText("Operation failed")
         else:
             self.status_label.setText("Completed")
-            self.statusBar.showMessage("Operation completed successfully")
+            self._statusbar_label.setText("Operation completed successfully")
             
             # Update summary
             count = result.get("count", 0)
@@ -737,7 +858,8 @@ class MainWindow(QMainWindow):
             if saved > 0:
                 self.space_label.setText(format_size(saved))
             
-            # Show report button if a report was generated
+            # Show report button if a report was generated; the worker returns the
+            # requested path even when writing the report failed
             if "report_path" in result and os.path.exists(result["report_path"]):
                 self.open_report_btn.setVisible(True)
                 self.report_file_path = result["report_path"]
@@ -750,24 +872,22 @@ class MainWindow(QMainWindow):
     
     def open_report(self):
         """Open the generated HTML report in the default browser"""
-        if hasattr(self, "report_file_path") and os.path.exists(self.report_file_path):
-            webbrowser.open(f"file://{os.path.abspath(self.report_file_path)}")
+        if not hasattr(self, "report_file_path"):
+            return
+        
+        if not webbrowser.open(f"file://{os.path.abspath(self.report_file_path)}"):
+            QMessageBox.warning(self, "Open Report",
+                                f"Could not open the report:\n{self.report_file_path}")
     
     def show_confirmation_dialog(self, path, size):
         """Show a confirmation dialog when interactive mode is enabled"""
         size_str = format_size(size)
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("Confirm Deletion")
-        msg_box.setText(f"Delete the following directory?\n\n{path}\n\nSize: {size_str}")
-        msg_box.setIcon(QMessageBox.Question)
-        msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-        msg_box.setDefaultButton(QMessageBox.No)
-        
-        # Make this dialog stay on top
-        msg_box.setWindowFlags(msg_box.windowFlags() | Qt.WindowStaysOnTopHint)
+        self._confirm_box.setText(f"Delete the following directory?\n\n{path}\n\nSize: {size_str}")
+        # exec_() leaves the last clicked button as default, so reset it each time
+        self._confirm_box.setDefaultButton(QMessageBox.No)
         
         # Show the dialog and get the response
-        result = msg_box.exec_()
+        result = self._confirm_box.exec_()
         confirmed = (result == QMessageBox.Yes)
         
         # Send the result back to the worker thread
@@ -800,74 +920,77 @@ class MainWindow(QMainWindow):
             params = {
                 "dry_run": self.dry_run_cb.isChecked(),
                 "trash": self.trash_cb.isChecked() if TRASH_SUPPORTED else False,
-                "interactive": self.interactive_cb.isChecked()
+                "interactive": self.interactive_cb.isChecked(),
+                "parallel": self.parallel_cb.isChecked(),
+                "summary_only": self.summary_only_cb.isChecked()
             }
             
-            # Create a new worker to handle deletions
-            self.worker_thread = WorkerThread("selected_items", **params)
-            self.worker_thread.log_update.connect(self.update_log)
-            self.worker_thread.progress_update.connect(self.update_progress)
-            self.worker_thread.operation_complete.connect(self.operation_completed)
-            
-            # Connect the confirmation signal if we're in interactive mode
-            if params.get("interactive", False):
-                self.worker_thread.confirmation_needed.connect(self.show_confirmation_dialog)
-            
-            # Start deleting
-            self.worker_thread.start()
-            
-            # Tell the worker to delete the selected items
-            self.worker_thread.delete_selected_items_and_emit(selected_items, **params)
+            # Hand the deletion to the long-lived selection worker
+            self.worker_thread = self.selection_worker
+            self.worker_thread.submit("selected_items", selected_items, **params)
             
-            self.statusBar.showMessage(f"Deleting {len(selected_items)} selected items...")
+            self._statusbar_label.setText(f"Deleting {len(selected_items)} selected items...")
         else:
             self.update_log("Operation cancelled by user.")
             self.operation_completed({"count": 0, "saved": 0})
     
     def show_about(self):
         """Show about dialog"""
-        about_text = """
-        <div style="text-align: center;">
-            <h1 style="color: #1976d2;">Directory Cleaner</h1>
-            <p style="font-size: 12px;">Version 1.0.0</p>
-        </div>
-        
-        <p>A powerful utility designed to help developers reclaim disk space by efficiently cleaning development directories.</p>
-        
-        <h3 style="color: #1976d2;">Key Features</h3>
-        <ul>
-            <li><b>Smart Cleaning:</b> Detect and remove node_modules folders, build artifacts, and cache directories</li>
-            <li><b>Custom Pattern Matching:</b> Find and delete directories matching specific patterns</li>
-            <li><b>Selective Operation:</b> Choose exactly which items to delete after scanning</li>
-            <li><b>Disk Usage Analysis:</b> Visualize which directories are consuming the most space</li>
-            <li><b>Interactive Mode:</b> Confirm each deletion with visual feedback</li>
-            <li><b>Safety First:</b> Dry-run mode and trash bin support to prevent accidental data loss</li>
-        </ul>
-        
-        <h3 style="color: #1976d2;">System Information</h3>
-        <p>Platform: {}<br>
-        Python: {}.{}.{}<br>
-        PyQt: {}</p>
-        
-        <h3 style="color: #1976d2;">License</h3>
-        <p>This software is released under the MIT License.<br>
-        Copyright © 2025 Directory Cleaner Team</p>
-        
-        <p style="font-size: 11px; color: #666;">
-        Third-party components:<br>
-        PyQt5 (GPL/Commercial)<br>
-        send2trash (BSD License)
-        </p>
-        
-        <div style="text-align: center; margin-top: 10px;">
-            <p><a href="https://github.com/directory-cleaner-team/directory-cleaner" style="color: #2196f3; text-decoration: none;">GitHub Project</a> | 
-            <a href="https://directory-cleaner.org" style="color: #2196f3; text-decoration: none;">Documentation</a></p>
-        </div>
-        """.format(
-            platform.system() + " " + platform.release(),
-            sys.version_info.major, sys.version_info.minor, sys.version_info.micro,
-            "5.15.x"  # PyQt version placeholder
-        )
+        # The formatted text and scaled icon are built on first use and reused
+        # by every later opening of the dialog
+        if MainWindow._about_html is None:
+            # Only needed for the About text, so don't pay for it at startup
+            import platform
+            
+            MainWindow._about_html = """
+            <div style="text-align: center;">
+                <h1 style="color: #1976d2;">Directory Cleaner</h1>
+                <p style="font-size: 12px;">Version 1.0.0</p>
+            </div>
+        
+            <p>A powerful utility designed to help developers reclaim disk space by efficiently cleaning development directories.</p>
+        
+            <h3 style="color: #1976d2;">Key Features</h3>
+            <ul>
+                <li><b>Smart Cleaning:</b> Detect and remove node_modules folders, build artifacts, and cache directories</li>
+                <li><b>Custom Pattern Matching:</b> Find and delete directories matching specific patterns</li>
+                <li><b>Selective Operation:</b> Choose exactly which items to delete after scanning</li>
+                <li><b>Disk Usage Analysis:</b> Visualize which directories are consuming the most space</li>
+                <li><b>Interactive Mode:</b> Confirm each deletion with visual feedback</li>
+                <li><b>Safety First:</b> Dry-run mode and trash bin support to prevent accidental data loss</li>
+            </ul>
+        
+            <h3 style="color: #1976d2;">System Information</h3>
+            <p>Platform: {}<br>
+            Python: {}.{}.{}<br>
+            PyQt: {}</p>
+        
+            <h3 style="color: #1976d2;">License</h3>
+            <p>This software is released under the MIT License.<br>
+            Copyright © 2025 Directory Cleaner Team</p>
+        
+            <p style="font-size: 11px; color: #666;">
+            Third-party components:<br>
+            PyQt5 (GPL/Commercial)<br>
+            send2trash (BSD License)
+            </p>
+        
+            <div style="text-align: center; margin-top: 10px;">
+                <p><a href="https://github.com/directory-cleaner-team/directory-cleaner" style="color: #2196f3; text-decoration: none;">GitHub Project</a> | 
+                <a href="https://directory-cleaner.org" style="color: #2196f3; text-decoration: none;">Documentation</a></p>
+            </div>
+            """.format(
+                platform.system() + " " + platform.release(),
+                sys.version_info.major, sys.version_info.minor, sys.version_info.micro,
+                "5.15.x"  # PyQt version placeholder
+            )
+        
+        # The smooth-scaled icon is kept in Qt's pixmap cache between openings
+        icon_pixmap = QPixmapCache.find(_ABOUT_ICON_KEY)
+        if (icon_pixmap is None or icon_pixmap.isNull()) and _ABOUT_ICON_PATH:
+            icon_pixmap = QPixmap(_ABOUT_ICON_PATH).scaled(
+                128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            QPixmapCache.insert(_ABOUT_ICON_KEY, icon_pixmap)
         
         # Create a custom dialog to have more control over the appearance
         about_dialog = QDialog(self)
@@ -879,28 +1002,15 @@ class MainWindow(QMainWindow):
         
         # Add the icon at the top
         icon_label = QLabel()
-        # Try to use PNG version first for better quality - updated path
-        png_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
-                              "resources", "icons", "cleaner_icon.PNG")
-        
-        if os.path.exists(png_path):
-            icon_pixmap = QPixmap(png_path).scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        if icon_pixmap is not None and not icon_pixmap.isNull():
             icon_label.setPixmap(icon_pixmap)
-        else:
-            # Fall back to ICO file if PNG is not available
-            ico_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
-                                  "resources", "icons", "cleaner_icon.ico")
-            if os.path.exists(ico_path):
-                icon_pixmap = QPixmap(ico_path).scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                icon_label.setPixmap(icon_pixmap)
-            
         icon_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(icon_label)
         
         # Add the about text
         text_browser = QTextBrowser()
         text_browser.setOpenExternalLinks(True)
-        text_browser.setHtml(about_text)
+        text_browser.setHtml(MainWindow._about_html)
         text_browser.setStyleSheet("border: none; background-color: transparent;")
         layout.addWidget(text_browser)
         
@@ -929,4 +1039,6 @@ class MainWindow(QMainWindow):
         """Handle window close event"""
         # Save configuration before closing
         self.save_config()
+        self.selection_worker.stop()
+        shutdown_pool()
         event.accept()
\ No newline at end of file
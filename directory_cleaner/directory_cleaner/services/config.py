@@ -6,11 +6,77 @@ files and cleaning presets.
 """
 
 import os
+import copy
+import logging
+import functools
 import configparser
 
 from directory_cleaner.directory_cleaner.core.file_utils import (
     normalize_path, parse_size
 )
+from directory_cleaner.directory_cleaner.core.dir_operations import delete_node_modules
+from directory_cleaner.directory_cleaner.core.analysis import delete_pattern_directories_multiple
+
+_log = logging.getLogger(__name__)
+
+# Predefined cleaning presets as (function, fixed arguments)
+_PRESETS = {
+    "node-modules": (delete_node_modules, {}),
+    "build-artifacts": (delete_pattern_directories_multiple, {
+        "patterns": ("build", "dist", "target", "out", "bin", "obj")
+    }),
+    "cache-dirs": (delete_pattern_directories_multiple, {
+        "patterns": (".cache", "__pycache__", ".gradle", ".npm", ".nuget")
+    }),
+    "temp-files": (delete_pattern_directories_multiple, {
+        "patterns": ("tmp", "temp", "*tmp", "*bak")
+    }),
+}
+
+# Accepted boolean spellings, as in ConfigParser.BOOLEAN_STATES
+_BOOLS = {
+    "1": True, "yes": True, "true": True, "on": True,
+    "0": False, "no": False, "false": False, "off": False,
+}
+
+
+def _split_csv(raw):
+    """Parse a comma-separated list value."""
+    return [p.strip() for p in raw.split(',')]
+
+
+def _parse_int_or_size(raw):
+    """Parse a plain integer or a size string like '10MB'."""
+    try:
+        return int(raw)
+    except ValueError:
+        return parse_size(raw)
+
+
+def _get_bool(raw):
+    """Parse a boolean value."""
+    value = _BOOLS.get(raw.strip().lower())
+    if value is None:
+        raise ValueError(f"Not a boolean: {raw}")
+    return value
+
+
+def _identity(raw):
+    """Return the raw string value."""
+    return raw
+
+
+# Value parser for each known profile key; other keys are kept as strings
+_KEY_PARSERS = {
+    'patterns': _split_csv,
+    'exclude': _split_csv,
+    'older_than': _parse_int_or_size,
+    'min_size': _parse_int_or_size,
+    'dry_run': _get_bool,
+    'trash': _get_bool,
+    'interactive': _get_bool,
+    'parallel': _get_bool,
+}
 
 
 def parse_config(config_file):
@@ -25,39 +91,38 @@ def parse_config(config_file):
     # Normalize the config file path
     config_file = normalize_path(config_file)
     
-    if not os.path.exists(config_file):
-        print(f"Config file not found: {config_file}")
+    try:
+        st = os.stat(config_file)
+    except OSError:
+        _log.warning("Config file not found: %s", config_file)
         return None
     
+    # Repeat calls for an unchanged file are served from the parse cache; callers
+    # get their own copy so they can't mutate the cached profiles
+    return copy.deepcopy(_parse_config_cached(config_file, st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_config_cached(config_file, mtime_ns, size):
+    """Parse config_file; mtime_ns and size only key the cache."""
     try:
         config = configparser.ConfigParser()
         config.read(config_file)
         
         profiles = {}
-        for section in config.sections():
+        for section_name in config.sections():
+            section = config[section_name]
             profile = {}
-            for key in config[section]:
-                if key == 'patterns':
-                    profile[key] = [p.strip() for p in config[section][key].split(',')]
-                elif key == 'exclude':
-                    profile[key] = [p.strip() for p in config[section][key].split(',')]
-                elif key in ('older_than', 'min_size'):
-                    try:
-                        profile[key] = int(config[section][key])
-                    except ValueError:
-                        try:
-                            profile[key] = parse_size(config[section][key])
-                        except ValueError:
-                            print(f"Warning: Invalid value for {key} in profile {section}")
-                            continue
-                elif key in ('dry_run', 'trash', 'interactive', 'parallel'):
-                    profile[key] = config[section].getboolean(key)
-                else:
-                    profile[key] = config[section][key]
+            for key, raw in section.items():
+                parser = _KEY_PARSERS.get(key, _identity)
+                try:
+                    profile[key] = parser(raw)
+                except ValueError:
+                    _log.warning("Invalid value for %s in profile %s", key, section_name)
             
-            profiles[section] = profile
+            profiles[section_name] = profile
     except Exception as e:
-        print(f"Error parsing config file: {e}")
+        _log.error("Error parsing config file: %s", e)
         return None
     
     return profiles
@@ -75,51 +140,19 @@ def run_preset(preset_name, directory, **kwargs):
         tuple: (count, saved, deleted_items) representing number of items deleted,
                bytes saved, and details of deleted items
     """
-    from directory_cleaner.directory_cleaner.core.dir_operations import delete_node_modules
-    from directory_cleaner.directory_cleaner.core.analysis import delete_pattern_directories_multiple
-    
     # Normalize the directory path
     directory = normalize_path(directory)
     
     # Check if directory exists
     if not os.path.exists(directory) or not os.path.isdir(directory):
-        print(f"Directory does not exist: {directory}")
+        _log.error("Directory does not exist: %s", directory)
         return 0, 0, []
     
-    presets = {
-        "node-modules": {
-            "func": delete_node_modules,
-            "args": {"directory": directory}
-        },
-        "build-artifacts": {
-            "func": delete_pattern_directories_multiple,
-            "args": {
-                "directory": directory, 
-                "patterns": ["build", "dist", "target", "out", "bin", "obj"]
-            }
-        },
-        "cache-dirs": {
-            "func": delete_pattern_directories_multiple,
-            "args": {
-                "directory": directory,
-                "patterns": [".cache", "__pycache__", ".gradle", ".npm", ".nuget"]
-            }
-        },
-        "temp-files": {
-            "func": delete_pattern_directories_multiple,
-            "args": {
-                "directory": directory,
-                "patterns": ["tmp", "temp", "*tmp", "*bak"]
-            }
-        }
-    }
-    
-    if preset_name not in presets:
-        print(f"Unknown preset: {preset_name}")
+    if preset_name not in _PRESETS:
+        _log.error("Unknown preset: %s", preset_name)
         return 0, 0, []
     
-    preset = presets[preset_name]
-    args = preset["args"].copy()
-    args.update(kwargs)
+    func, base_args = _PRESETS[preset_name]
+    args = {"directory": directory, **base_args, **kwargs}
     
-    return preset["func"](**args)
\ No newline at end of file
+    return func(**args)
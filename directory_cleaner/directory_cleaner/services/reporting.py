@@ -5,51 +5,23 @@ This module provides functions to generate HTML reports of cleaning operations.
 """
 
 import os
+import logging
 import datetime
+import itertools
+from typing import Iterable, NamedTuple, Optional
 
 from directory_cleaner.directory_cleaner.core.file_utils import normalize_path
 
+_log = logging.getLogger(__name__)
 
-def generate_html_report(report_data, filename="cleanup_report.html"):
-    """Generate an HTML report from cleanup data.
-    
-    Args:
-        report_data (dict): Data to include in the report with format:
-            {
-                "sections": [
-                    {
-                        "title": str,
-                        "items": [{"path": str, "size": str, "status": str}, ...]
-                    },
-                    ...
-                ],
-                "total_space": str
-            }
-        filename (str): Path where to save the HTML report
-        
-    Returns:
-        str: Path to the saved report file
-    """
-    # Normalize the output filename
-    filename = normalize_path(filename)
-    
-    # Create directory for the report if it doesn't exist
-    report_dir = os.path.dirname(filename)
-    if report_dir and not os.path.exists(report_dir):
-        try:
-            os.makedirs(report_dir)
-        except OSError as e:
-            print(f"Error creating directory for report: {e}")
-            # Fall back to current directory
-            filename = os.path.basename(filename)
-    
-    # Get the timestamp
-    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    total_items = sum(len(section.get("items", [])) for section in report_data.get("sections", []))
-    total_space = report_data.get("total_space", "0 B")
-    
-    # Create the HTML content with actual data
-    html = f"""<!DOCTYPE html>
+# Buffer size for writing reports, large enough to keep write syscalls few
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Translation table for escaping text interpolated into the HTML report
+_HTML_TRANS = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+# Static report boilerplate; the header takes the timestamp and summary values
+_HTML_HEADER_TMPL = """<!DOCTYPE html>
 <html>
 <head>
     <title>Directory Cleanup Report</title>
@@ -62,6 +34,7 @@ def generate_html_report(report_data, filename="cleanup_report.html"):
         tr:hover {{ background-color: #f5f5f5; }}
         .summary {{ background-color: #e9f7ef; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
         .timestamp {{ color: #666; font-size: 0.9em; }}
+        .empty {{ color: #666; }}
     </style>
 </head>
 <body>
@@ -70,55 +43,166 @@ def generate_html_report(report_data, filename="cleanup_report.html"):
     
     <div class="summary">
         <h2>Summary</h2>
-        <p>Total items processed: {total_items}</p>
-        <p>Total space saved: {total_space}</p>
+        <p>Total items processed: {n}</p>
+        <p>Total space saved: {s}</p>
     </div>
 """
-    
-    # Add each section with its items
-    for section in report_data.get("sections", []):
-        html += f"\n    <h2>{section['title']}</h2>\n"
-        
-        items = section.get("items", [])
-        if items:
-            html += """    <table>
+_HTML_FOOTER = """</body>
+</html>"""
+
+# Report table header and row templates
+_TABLE_HEADER = """    <table>
         <tr>
             <th>Path</th>
             <th>Size</th>
             <th>Status</th>
         </tr>
 """
-            # Add each item in the table
-            for item in items:
-                html += f"""        <tr>
-            <td>{item['path']}</td>
-            <td>{item['size']}</td>
-            <td>{item['status']}</td>
+_ROW_TMPL = """        <tr>
+            <td>{}</td>
+            <td>{}</td>
+            <td>{}</td>
         </tr>
 """
-            html += "    </table>\n"
-        else:
-            html += "    <p>No items found.</p>\n"
+
+
+class ReportItem(NamedTuple):
+    """A row of a report section."""
+    path: str
+    size: str
+    status: str
+
+
+class ReportSection(NamedTuple):
+    """A titled table of report items; count is required if items is an iterator."""
+    title: str
+    items: Iterable[ReportItem]
+    count: Optional[int] = None
+
+
+def generate_html_report(report_data, filename="cleanup_report.html"):
+    """Generate an HTML report from cleanup data.
     
-    # Close the HTML document
-    html += """</body>
-</html>"""
+    Args:
+        report_data (dict): Data to include in the report with format:
+            {
+                "sections": [ReportSection, ...],
+                "total_space": str
+            }
+        filename (str): Path where to save the HTML report
+        
+    Returns:
+        str: Path to the saved report file
+    """
+    # Normalize the output filename
+    filename = normalize_path(filename)
+    
+    # Create directory for the report if it doesn't exist
+    report_dir = os.path.dirname(filename)
+    if report_dir:
+        try:
+            os.makedirs(report_dir, exist_ok=True)
+        except OSError as e:
+            _log.error("Error creating directory for report: %s", e)
+            # Fall back to current directory
+            filename = os.path.basename(filename)
+    
+    # Get the timestamp
+    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    sections = report_data.get("sections", ())
+    total_items = 0
+    for section in sections:
+        count = section.count
+        if count is None:
+            count = len(section.items) if section.items else 0
+        total_items += count
+    total_space = report_data.get("total_space", "0 B")
+    
+    # Section items may be iterators that can only be consumed once, so pick
+    # the location before rendering: if the report can't be created where
+    # requested, try the current directory as fallback. A failure while writing
+    # can't be retried elsewhere, as the items have been used up by then.
+    try:
+        f = _open_report_file(filename)
+        fallback = False
+    except OSError as e:
+        _log.error("Error writing report file: %s", e)
+        filename = os.path.basename(filename)
+        try:
+            f = _open_report_file(filename)
+            fallback = True
+        except OSError as e2:
+            _log.error("Failed to write report file: %s", e2)
+            return filename
     
     # Write to file
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(html)
-        print(f"HTML report generated: {filename}")
+        _write_report_file(f, filename, sections, now, total_items, total_space)
     except Exception as e:
-        print(f"Error writing report file: {e}")
-        # Try writing to current directory as fallback
-        fallback_path = os.path.basename(filename)
+        _log.error("Failed to write report file: %s", e)
+        return filename
+    
+    if fallback:
+        _log.info("HTML report generated at fallback location: %s", filename)
+    else:
+        _log.info("HTML report generated: %s", filename)
+    
+    return filename
+
+
+def _open_report_file(filename):
+    """Open the temporary file the report for filename is written to."""
+    return open(filename + ".tmp", "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE)
+
+
+def _write_report_file(f, filename, sections, now, total_items, total_space):
+    """Stream the report to the temporary file f, then move it into place at filename.
+    
+    Writing to a temporary file keeps a partially written report from replacing
+    an existing one if rendering fails part way through. The temporary file is
+    removed if either the write or the move fails.
+    """
+    try:
+        with f:
+            _write_html(f, sections, now, total_items, total_space)
+        os.replace(f.name, filename)
+    except BaseException:
         try:
-            with open(fallback_path, "w", encoding="utf-8") as f:
-                f.write(html)
-            print(f"HTML report generated at fallback location: {fallback_path}")
-            filename = fallback_path
-        except Exception as e2:
-            print(f"Failed to write report file: {e2}")
+            os.unlink(f.name)
+        except OSError:
+            pass
+        raise
+
+
+def _write_html(f, sections, now, total_items, total_space):
+    """Write the report HTML to the open file f section by section."""
+    write = f.write
+    write(_HTML_HEADER_TMPL.format(now=now, n=total_items, s=total_space))
+    
+    # Add each section with its items; empty sections are collapsed into one line
+    empty_titles = []
+    for section in sections:
+        title = section.title.translate(_HTML_TRANS)
+        # Items may be a generator, so look at the first one rather than testing truthiness
+        items = iter(section.items or ())
+        first = next(items, None)
+        if first is None:
+            empty_titles.append(title)
+            continue
+        
+        write(f"\n    <h2>{title}</h2>\n")
+        write(_TABLE_HEADER)
+        # Add each item in the table
+        for item in itertools.chain((first,), items):
+            write(_ROW_TMPL.format(
+                item.path.translate(_HTML_TRANS),
+                item.size.translate(_HTML_TRANS),
+                item.status.translate(_HTML_TRANS)
+            ))
+        write("    </table>\n")
     
-    return filename
\ No newline at end of file
+    if empty_titles:
+        write(f"\n    <p class=\"empty\">No items found in: {', '.join(empty_titles)}</p>\n")
+    
+    # Close the HTML document
+    write(_HTML_FOOTER)
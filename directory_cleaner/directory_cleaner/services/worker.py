@@ -5,29 +5,226 @@ This module provides a QThread-based worker implementation to prevent UI freezin
 during long-running operations.
 """
 
+import io
 import os
+import queue
+import shutil
+import logging
+import functools
+import threading
+import contextlib
 import traceback
 import fnmatch
-from PyQt5.QtCore import QThread, pyqtSignal, pyqtSlot, QObject, QEventLoop
+import concurrent.futures
+from PyQt5.QtCore import QThread, pyqtSignal, pyqtSlot
 
+try:
+    import send2trash
+except ImportError:
+    send2trash = None
+
+from directory_cleaner.directory_cleaner.core import size_cache
 from directory_cleaner.directory_cleaner.core.file_utils import (
     normalize_path, get_dir_size, format_size, parse_size, TRASH_SUPPORTED
 )
 from directory_cleaner.directory_cleaner.core.dir_operations import (
     delete_directory, should_process, delete_node_modules, delete_subdirectories,
-    delete_pattern_directories, delete_empty_directories
+    delete_pattern_directories, delete_empty_directories, find_empty_directories
 )
-from directory_cleaner.directory_cleaner.core.analysis import (
-    analyze_disk_usage, find_cleaning_opportunities, delete_pattern_directories_multiple
+from directory_cleaner.directory_cleaner.services.reporting import (
+    ReportItem, ReportSection, generate_html_report
 )
-from directory_cleaner.directory_cleaner.services.reporting import generate_html_report
-from directory_cleaner.directory_cleaner.services.config import run_preset
 
+# Parent logger of all application modules
+_pkg_log = logging.getLogger("directory_cleaner")
+
+# Minimum interval in seconds between batched log_update emissions
+_LOG_FLUSH_INTERVAL = 0.05
+
+# Number of threads used to delete or size selected items in parallel
+_POOL_WORKERS = min(8, os.cpu_count() or 1)
+
+# Directory walks can stat entries relative to their parent's descriptor (POSIX)
+_HAVE_FWALK = hasattr(os, "fwalk") and os.stat in os.supports_dir_fd
+
+# Thread pool shared by all parallel deletion and sizing, created on first use
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class _SignalLogHandler(logging.Handler):
+    """Logging handler that forwards records logged on the current thread to a callback"""
+    
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+        self.thread_id = threading.get_ident()
+    
+    def emit(self, record):
+        if record.thread == self.thread_id:
+            self.callback(self.format(record))
+
+
+class _LogStream(io.TextIOBase):
+    """Text stream that passes each complete line written to it to a callback"""
+    
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+        # Unfinished line per writing thread; print() writes the text and its
+        # newline separately, so a shared buffer would mix concurrent prints
+        self._partials = {}
+        self._lock = threading.Lock()
+    
+    def writable(self):
+        return True
+    
+    def write(self, s):
+        thread_id = threading.get_ident()
+        with self._lock:
+            *lines, partial = (self._partials.pop(thread_id, "") + s).split("\n")
+            if partial:
+                self._partials[thread_id] = partial
+        for line in lines:
+            self.callback(line)
+        return len(s)
+    
+    def flush(self):
+        with self._lock:
+            partials = list(self._partials.values())
+            self._partials.clear()
+        for partial in partials:
+            self.callback(partial)
+
+
+def _iter_dirs(root, recursive=False, prune=None):
+    """Yield (name, path, dir_fd) for each subdirectory of root.
+    
+    With recursive set, subdirectories are descended into as well, except those
+    for which prune(name) is true. As with os.walk, symlinked directories are
+    listed but not descended into, and unreadable directories are skipped.
+    
+    Where os.fwalk is available, dir_fd is an open descriptor of the directory
+    containing the subdirectory, valid until the next item is requested, so it
+    can be stat'ed without resolving its full path again. Elsewhere the walk
+    uses os.scandir and dir_fd is None.
+    """
+    if _HAVE_FWALK:
+        for dirpath, dirnames, _, dirfd in os.fwalk(root):
+            descend = []
+            for name in dirnames:
+                yield name, os.path.join(dirpath, name), dirfd
+                if recursive and not (prune and prune(name)):
+                    descend.append(name)
+            if not recursive:
+                return
+            dirnames[:] = descend
+        return
+    
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    yield entry.name, entry.path, None
+                    if recursive and not entry.is_symlink() and not (prune and prune(entry.name)):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+
+
+def _has_ancestor_in(path, paths):
+    """Return True if a directory containing path is in the set paths."""
+    parent = os.path.dirname(path)
+    while parent != path:
+        if parent in paths:
+            return True
+        path, parent = parent, os.path.dirname(parent)
+    return False
+
+
+def _get_pool():
+    """Return the shared thread pool, creating it on first use.
+    
+    The GUI shuts the pool down with shutdown_pool() when its window closes.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = concurrent.futures.ThreadPoolExecutor(max_workers=_POOL_WORKERS)
+        return _pool
+
+
+def shutdown_pool():
+    """Shut down the shared thread pool without waiting for queued work."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+            _pool = None
+
+
+def _with_sizes(paths, category):
+    """Return (path, size, category) tuples for normalized paths, sizing
+    directories in parallel."""
+    sized = functools.partial(get_dir_size, normalized=True)
+    if len(paths) > 1:
+        sizes = list(_get_pool().map(sized, paths))
+    else:
+        sizes = [sized(path) for path in paths]
+    return [(path, size, category) for path, size in zip(paths, sizes)]
+
+
+def _report_items(rows, fmt, status=None):
+    """Lazily yield report items for (path, size, status) rows, or for (path, size)
+    rows all given the same status."""
+    if status is None:
+        for path, size, row_status in rows:
+            yield ReportItem(path, fmt(size), row_status)
+    else:
+        for path, size in rows:
+            yield ReportItem(path, fmt(size), status)
+
+
+def _run_preset(*args, **kwargs):
+    """Run a preset, importing the config module only once a preset is used."""
+    from directory_cleaner.directory_cleaner.services.config import run_preset
+    return run_preset(*args, **kwargs)
 
-class InteractiveConfirmation(QObject):
-    """Helper class to handle interactive confirmations from the GUI thread"""
-    confirmation_result = None
-    wait_for_confirmation = pyqtSignal(str, float)  # Path and size
+
+# Deletion operations run by WorkerThread.run, as (function, names of the
+# kwargs passed positionally, report section title, log summary when items
+# were found, log summary when none were); the texts are formatted with the
+# worker kwargs
+_OPERATIONS = {
+    "node_modules": (
+        delete_node_modules, ("directory",), "Node Modules",
+        "Found and processed {count} node_modules folders, saving {saved}",
+        "No node_modules folders found matching your criteria."
+    ),
+    "subdirs": (
+        delete_subdirectories, ("directory",), "Subdirectories",
+        "Found and processed {count} subdirectories, saving {saved}",
+        "No subdirectories found matching your criteria."
+    ),
+    "pattern": (
+        delete_pattern_directories, ("directory", "pattern"), "Pattern: {pattern}",
+        "Found and processed {count} pattern matches, saving {saved}",
+        "No directories matching pattern found."
+    ),
+    "preset": (
+        _run_preset, ("preset_name", "directory"), "Preset: {preset_name}",
+        "Preset '{preset_name}' processed {count} items, saving {saved}",
+        "No items found for preset '{preset_name}'."
+    ),
+    "empty_dirs": (
+        delete_empty_directories, ("directory",), "Empty Directories",
+        "Found and deleted {count} empty directories",
+        "No empty directories found matching your criteria."
+    ),
+}
 
 
 class WorkerThread(QThread):
@@ -38,48 +235,58 @@ class WorkerThread(QThread):
     confirmation_needed = pyqtSignal(str, float)  # Path and size
     scan_complete = pyqtSignal(list)  # For selective deletion
     
-    def __init__(self, operation, **kwargs):
+    def __init__(self, operation=None, **kwargs):
+        """Create a worker for a single operation, or a persistent worker if
+        operation is None (tasks are then passed in with submit())."""
         super().__init__()
         self.operation = operation
         self.kwargs = kwargs
+        self._tasks = queue.Queue()
+        self._log_buf = []
+        self._log_lock = threading.Lock()
+        self._log_timer = None
         self.report_data = {
             "sections": [],
             "total_space": "0 B"
         }
-        self.interactive_helper = InteractiveConfirmation()
-        self.interactive_helper.wait_for_confirmation.connect(self.wait_for_user_confirmation)
+        
+        # Set by the GUI thread once the user has answered a confirmation
+        self._confirm_event = threading.Event()
+        self._confirm_result = False
         
         # Add operation progress tracking
         self.total_items = 0
         self.processed_items = 0
         
         # Add a monitor method for dir_cleaner functions to call
+        self._last_percent = -1
         self.update_progress_percent(0)  # Start at 0%
         
-    def custom_delete_directory(self, path, dry_run=False, trash=False, interactive=False):
+    def custom_delete_directory(self, path, dry_run=False, trash=False, interactive=False, verbose=True):
         """Override dir_cleaner's delete_directory to use GUI confirmation"""
         # Normalize the path first
         path = normalize_path(path)
         
         # Check if directory actually exists
         if not os.path.exists(path) or not os.path.isdir(path):
-            self.log_update.emit(f"✗ Cannot delete: {path} - Directory does not exist")
+            self._enqueue_log(f"✗ Cannot delete: {path} - Directory does not exist")
             return 0
         
-        size = get_dir_size(path)
+        size = get_dir_size(path, normalized=True)
         
         if interactive:
             # Instead of terminal input, emit signal for GUI confirmation
+            self._flush_log()
+            self._confirm_event.clear()
             self.confirmation_needed.emit(path, size)
             
             # Wait for the confirmation result
-            loop = QEventLoop()
-            self.interactive_helper.wait_for_confirmation.connect(lambda *args: loop.quit())
-            loop.exec_()
+            self._confirm_event.wait()
             
             # Check the confirmation result
-            if not self.interactive_helper.confirmation_result:
-                self.log_update.emit(f"Skipping: {path}")
+            if not self._confirm_result:
+                if verbose:
+                    self._enqueue_log(f"Skipping: {path}")
                 return 0
         
         if not dry_run:
@@ -87,408 +294,318 @@ class WorkerThread(QThread):
                 if trash and TRASH_SUPPORTED:
                     # Path needs to be absolute for send2trash
                     absolute_path = os.path.abspath(path)
-                    import send2trash
                     send2trash.send2trash(absolute_path)
-                    self.log_update.emit(f"✓ Moved to trash: {path} ({format_size(size)})")
+                    if verbose:
+                        self._enqueue_log(f"✓ Moved to trash: {path} ({format_size(size)})")
                 else:
-                    import shutil
                     shutil.rmtree(path)
-                    self.log_update.emit(f"✓ Deleted: {path} ({format_size(size)})")
+                    if verbose:
+                        self._enqueue_log(f"✓ Deleted: {path} ({format_size(size)})")
+                size_cache.discard(path)
                 return size
             except Exception as e:
-                self.log_update.emit(f"✗ Failed to delete {path}: {e}")
+                self._enqueue_log(f"✗ Failed to delete {path}: {e}")
                 return 0
         else:
-            self.log_update.emit(f"Would delete: {path} ({format_size(size)})")
+            if verbose:
+                self._enqueue_log(f"Would delete: {path} ({format_size(size)})")
             return size
     
-    def wait_for_user_confirmation(self, path, size):
-        """Wait method - this will be called after the main thread processes the confirmation dialog"""
-        pass  # Just a placeholder to receive the signal when confirmation is complete
-
+    def _enqueue_log(self, message):
+        """Buffer a log message; the buffer is emitted within one flush interval
+        of its first message, even if the operation goes quiet meanwhile"""
+        with self._log_lock:
+            self._log_buf.append(message)
+            if self._log_timer is None:
+                self._log_timer = threading.Timer(_LOG_FLUSH_INTERVAL, self._flush_log)
+                self._log_timer.daemon = True
+                self._log_timer.start()
+    
+    def _flush_log(self):
+        """Emit all buffered log messages as a single log_update"""
+        with self._log_lock:
+            batch = self._log_buf
+            self._log_buf = []
+            timer, self._log_timer = self._log_timer, None
+        if timer is not None:
+            timer.cancel()
+        if batch:
+            self.log_update.emit("\n".join(batch))
+    
     def run(self):
         """Run the selected operation in the background"""
+        if self.operation is None:
+            self.process_tasks()
+            return
+        
         result = {"count": 0, "saved": 0}
+        size_cache.clear()
         
-        try:
-            # Redirect print statements to the log
-            import builtins
-            original_print = builtins.print
-            
-            def custom_print(*args, **kwargs):
-                message = " ".join(str(arg) for arg in args)
-                self.log_update.emit(message)
-                # Still allow print to work normally
-                original_print(*args, **kwargs)
-            
-            builtins.print = custom_print
-            
-            # Extract parameters
-            directory = self.kwargs.get("directory")
-            report_path = self.kwargs.get("report_path")
-            interactive = self.kwargs.get("interactive", False)
-            
-            self.log_update.emit(f"Starting operation: {self.operation}")
-            self.log_update.emit(f"Directory: {directory}")
-            
-            # For interactive mode, we'll use our custom delete_directory function
-            if interactive:
-                # Store reference to original function to restore later
-                import directory_cleaner.directory_cleaner.core.dir_operations as dir_ops
-                original_delete_directory = dir_ops.delete_directory
-                # Replace with our custom function
-                dir_ops.delete_directory = self.custom_delete_directory
-            
-            # Run the appropriate operation
-            if self.operation == "node_modules":
-                self.progress_update.emit(10)  # Show early progress to indicate we're working
-                count, saved, deleted_items = delete_node_modules(
-                    directory,
-                    dry_run=self.kwargs.get("dry_run", False),
-                    exclude=self.kwargs.get("exclude"),
-                    older_than=self.kwargs.get("older_than"),
-                    min_size=parse_size(self.kwargs.get("min_size", "0")) if self.kwargs.get("min_size") else 0,
-                    trash=self.kwargs.get("trash", False),
-                    interactive=self.kwargs.get("interactive", False),
-                    parallel=False if self.kwargs.get("interactive", False) else self.kwargs.get("parallel", False)
-                )
-                self.progress_update.emit(90)  # Show progress near completion
-                result["count"] = count
-                result["saved"] = saved
-                
-                if report_path:
-                    items = []
-                    for path, size, status in deleted_items:
-                        items.append({
-                            "path": path,
-                            "size": format_size(size),
-                            "status": status
-                        })
-                    
-                    self.report_data["sections"].append({
-                        "title": "Node Modules",
-                        "items": items
-                    })
-                    
-                if count > 0:
-                    self.log_update.emit(f"\nFound and processed {count} node_modules folders, saving {format_size(saved)}")
-                else:
-                    self.log_update.emit(f"\nNo node_modules folders found matching your criteria.")
-                    
-            elif self.operation == "subdirs":
-                self.progress_update.emit(10)  # Show early progress to indicate we're working
-                count, saved, deleted_items = delete_subdirectories(
-                    directory,
-                    dry_run=self.kwargs.get("dry_run", False),
-                    exclude=self.kwargs.get("exclude"),
-                    older_than=self.kwargs.get("older_than"),
-                    min_size=parse_size(self.kwargs.get("min_size", "0")) if self.kwargs.get("min_size") else 0,
-                    trash=self.kwargs.get("trash", False),
-                    interactive=self.kwargs.get("interactive", False),
-                    parallel=False if self.kwargs.get("interactive", False) else self.kwargs.get("parallel", False)
-                )
-                self.progress_update.emit(90)  # Show progress near completion
-                result["count"] = count
-                result["saved"] = saved
-                
-                if report_path:
-                    items = []
-                    for path, size, status in deleted_items:
-                        items.append({
-                            "path": path,
-                            "size": format_size(size),
-                            "status": status
-                        })
-                    
-                    self.report_data["sections"].append({
-                        "title": "Subdirectories",
-                        "items": items
-                    })
-                    
-                if count > 0:
-                    self.log_update.emit(f"\nFound and processed {count} subdirectories, saving {format_size(saved)}")
-                else:
-                    self.log_update.emit(f"\nNo subdirectories found matching your criteria.")
-                    
-            elif self.operation == "pattern":
-                self.progress_update.emit(10)  # Show early progress to indicate we're working
-                pattern = self.kwargs.get("pattern")
-                count, saved, deleted_items = delete_pattern_directories(
-                    directory, 
-                    pattern,
-                    dry_run=self.kwargs.get("dry_run", False),
-                    exclude=self.kwargs.get("exclude"),
-                    older_than=self.kwargs.get("older_than"),
-                    min_size=parse_size(self.kwargs.get("min_size", "0")) if self.kwargs.get("min_size") else 0,
-                    trash=self.kwargs.get("trash", False),
-                    interactive=self.kwargs.get("interactive", False),
-                    parallel=False if self.kwargs.get("interactive", False) else self.kwargs.get("parallel", False)
-                )
-                self.progress_update.emit(90)  # Show progress near completion
-                result["count"] = count
-                result["saved"] = saved
+        # Directory sizes repeat a lot (empty dirs, similar node_modules), so
+        # memoize their formatting for this run
+        fmt = functools.lru_cache(maxsize=4096)(format_size)
+        
+        # Route the package's log records to the GUI log while the operation runs
+        log_handler = _SignalLogHandler(self._enqueue_log)
+        _pkg_log.addHandler(log_handler)
+        
+        # Redirect print statements from the cleaning functions to the log
+        params = self.kwargs
+        log_stream = _LogStream(self._enqueue_log)
+        with contextlib.redirect_stdout(log_stream):
+            try:
+                # Extract parameters once, rather than in each operation
+                directory = params.get("directory")
+                report_path = params.get("report_path")
+                interactive = params.get("interactive", False)
+                dry_run = params.get("dry_run", False)
+                exclude = params.get("exclude")
+                older_than = params.get("older_than")
+                min_size = params.get("min_size")
+                trash = params.get("trash", False)
+                parallel = False if interactive else params.get("parallel", False)
+                # With summary_only, the cleaning functions report failures and
+                # totals but not each item they process
+                verbose = not params.get("summary_only", False)
                 
-                if report_path:
-                    items = []
-                    for path, size, status in deleted_items:
-                        items.append({
-                            "path": path,
-                            "size": format_size(size),
-                            "status": status
-                        })
-                    
-                    self.report_data["sections"].append({
-                        "title": f"Pattern: {pattern}",
-                        "items": items
-                    })
-                    
-                if count > 0:
-                    self.log_update.emit(f"\nFound and processed {count} pattern matches, saving {format_size(saved)}")
-                else:
-                    self.log_update.emit(f"\nNo directories matching pattern found.")
-                    
-            elif self.operation == "analyze":
-                self.progress_update.emit(10)  # Show early progress to indicate we're working
-                depth = self.kwargs.get("depth", 3)
-                results = analyze_disk_usage(directory, depth)
-                self.progress_update.emit(90)  # Show progress near completion
+                self._enqueue_log(f"Starting operation: {self.operation}")
+                self._enqueue_log(f"Directory: {directory}")
                 
-                # For analysis, return the top results
-                count = len(results)
-                saved = sum(size for _, size in results)
-                result["count"] = count
-                result["saved"] = saved
+                # For interactive mode, we'll use our custom delete_directory function
+                if interactive:
+                    # Store reference to original function to restore later
+                    import directory_cleaner.directory_cleaner.core.dir_operations as dir_ops
+                    original_delete_directory = dir_ops.delete_directory
+                    # Replace with our custom function
+                    dir_ops.delete_directory = self.custom_delete_directory
                 
-                if report_path:
-                    items = []
-                    for path, size in results[:50]:  # Limit to top 50
-                        items.append({
-                            "path": path,
-                            "size": format_size(size),
-                            "status": "Analyzed"
-                        })
+                # Run the appropriate operation
+                if self.operation in _OPERATIONS:
+                    func, arg_names, title, found_msg, none_msg = _OPERATIONS[self.operation]
+                    self.progress_update.emit(10)  # Show early progress to indicate we're working
+                    count, saved, deleted_items = func(
+                        *[params.get(name) for name in arg_names],
+                        dry_run=dry_run,
+                        exclude=exclude,
+                        older_than=older_than,
+                        min_size=parse_size(min_size) if min_size else 0,
+                        trash=trash,
+                        interactive=interactive,
+                        parallel=parallel,
+                        verbose=verbose
+                    )
+                    self.progress_update.emit(90)  # Show progress near completion
+                    result["count"] = count
+                    result["saved"] = saved
                     
-                    self.report_data["sections"].append({
-                        "title": "Disk Usage Analysis",
-                        "items": items
-                    })
+                    if report_path:
+                        self.report_data["sections"].append(ReportSection(
+                            title.format(**params),
+                            _report_items(deleted_items, fmt),
+                            len(deleted_items)
+                        ))
+                        
+                    if count > 0:
+                        self._enqueue_log("\n" + found_msg.format(count=count, saved=fmt(saved), **params))
+                    else:
+                        self._enqueue_log("\n" + none_msg.format(**params))
+                        
+                elif self.operation == "analyze":
+                    self.progress_update.emit(10)  # Show early progress to indicate we're working
+                    depth = params.get("depth", 3)
+                    from directory_cleaner.directory_cleaner.core.analysis import analyze_disk_usage
+                    results = analyze_disk_usage(directory, depth)
+                    self.progress_update.emit(90)  # Show progress near completion
                     
-                if count > 0:
-                    self.log_update.emit(f"\nAnalyzed {count} directories, total size: {format_size(saved)}")
-                else:
-                    self.log_update.emit(f"\nNo directories found to analyze.")
+                    # For analysis, return the top results
+                    count = len(results)
+                    saved = sum(size for _, size in results)
+                    result["count"] = count
+                    result["saved"] = saved
                     
-            elif self.operation == "discover":
-                self.progress_update.emit(10)  # Show early progress to indicate we're working
-                opportunities = find_cleaning_opportunities(directory)
-                self.progress_update.emit(90)  # Show progress near completion
-                
-                # Flatten all opportunities for reporting
-                all_items = []
-                for category, items in opportunities.items():
-                    result["count"] += len(items)
-                    result["saved"] += sum(size for _, size in items)
-                    all_items.extend([(category, path, size) for path, size in items])
-                
-                if report_path:
-                    for category, items in opportunities.items():
-                        category_items = []
-                        for path, size in items:
-                            category_items.append({
-                                "path": path,
-                                "size": format_size(size),
-                                "status": "Potential cleanup"
-                            })
+                    if report_path:
+                        top_results = results[:50]  # Limit to top 50
+                        self.report_data["sections"].append(ReportSection(
+                            "Disk Usage Analysis",
+                            _report_items(top_results, fmt, "Analyzed"),
+                            len(top_results)
+                        ))
                         
-                        if category_items:
-                            self.report_data["sections"].append({
-                                "title": category.replace('_', ' ').title(),
-                                "items": category_items
-                            })
+                    if count > 0:
+                        self._enqueue_log(f"\nAnalyzed {count} directories, total size: {fmt(saved)}")
+                    else:
+                        self._enqueue_log(f"\nNo directories found to analyze.")
+                        
+                elif self.operation == "discover":
+                    self.progress_update.emit(10)  # Show early progress to indicate we're working
+                    from directory_cleaner.directory_cleaner.core.analysis import find_cleaning_opportunities
+                    opportunities = find_cleaning_opportunities(directory)
+                    self.progress_update.emit(90)  # Show progress near completion
                     
-                if result["count"] > 0:
-                    self.log_update.emit(f"\nDiscovered {result['count']} cleanup opportunities, potential savings: {format_size(result['saved'])}")
-                else:
-                    self.log_update.emit(f"\nNo cleanup opportunities found.")
+                    for category, items in opportunities.items():
+                        result["count"] += len(items)
+                        result["saved"] += sum(size for _, size in items)
                     
-            elif self.operation == "preset":
-                self.progress_update.emit(10)  # Show early progress to indicate we're working
-                preset_name = self.kwargs.get("preset_name")
-                count, saved, deleted_items = run_preset(
-                    preset_name, 
-                    directory,
-                    dry_run=self.kwargs.get("dry_run", False),
-                    exclude=self.kwargs.get("exclude"),
-                    older_than=self.kwargs.get("older_than"),
-                    min_size=parse_size(self.kwargs.get("min_size", "0")) if self.kwargs.get("min_size") else 0,
-                    trash=self.kwargs.get("trash", False),
-                    interactive=self.kwargs.get("interactive", False),
-                    parallel=False if self.kwargs.get("interactive", False) else self.kwargs.get("parallel", False)
-                )
-                self.progress_update.emit(90)  # Show progress near completion
-                result["count"] = count
-                result["saved"] = saved
+                    if report_path:
+                        for category, items in opportunities.items():
+                            if items:
+                                self.report_data["sections"].append(ReportSection(
+                                    category.replace('_', ' ').title(),
+                                    _report_items(items, fmt, "Potential cleanup"),
+                                    len(items)
+                                ))
+                        
+                    if result["count"] > 0:
+                        self._enqueue_log(f"\nDiscovered {result['count']} cleanup opportunities, potential savings: {fmt(result['saved'])}")
+                    else:
+                        self._enqueue_log(f"\nNo cleanup opportunities found.")
                 
+                # Generate report if requested
                 if report_path:
-                    items = []
-                    for path, size, status in deleted_items:
-                        items.append({
-                            "path": path,
-                            "size": format_size(size),
-                            "status": status
-                        })
-                    
-                    self.report_data["sections"].append({
-                        "title": f"Preset: {preset_name}",
-                        "items": items
-                    })
-                    
-                if count > 0:
-                    self.log_update.emit(f"\nPreset '{preset_name}' processed {count} items, saving {format_size(saved)}")
-                else:
-                    self.log_update.emit(f"\nNo items found for preset '{preset_name}'.")
-            
-            elif self.operation == "empty_dirs":
-                self.progress_update.emit(10)  # Show early progress to indicate we're working
-                count, saved, deleted_items = delete_empty_directories(
-                    directory,
-                    dry_run=self.kwargs.get("dry_run", False),
-                    exclude=self.kwargs.get("exclude"),
-                    older_than=self.kwargs.get("older_than"),
-                    min_size=parse_size(self.kwargs.get("min_size", "0")) if self.kwargs.get("min_size") else 0,
-                    trash=self.kwargs.get("trash", False),
-                    interactive=self.kwargs.get("interactive", False),
-                    parallel=False if self.kwargs.get("interactive", False) else self.kwargs.get("parallel", False)
-                )
-                self.progress_update.emit(90)  # Show progress near completion
-                result["count"] = count
-                result["saved"] = saved
+                    self.report_data["total_space"] = fmt(result["saved"])
+                    generated_file = generate_html_report(self.report_data, report_path)
+                    result["report_path"] = generated_file
                 
-                if report_path:
-                    items = []
-                    for path, size, status in deleted_items:
-                        items.append({
-                            "path": path,
-                            "size": format_size(size),
-                            "status": status
-                        })
-                    
-                    self.report_data["sections"].append({
-                        "title": "Empty Directories",
-                        "items": items
-                    })
-                    
-                if count > 0:
-                    self.log_update.emit(f"\nFound and deleted {count} empty directories")
-                else:
-                    self.log_update.emit(f"\nNo empty directories found matching your criteria.")
-            
-            # Generate report if requested
-            if report_path:
-                self.report_data["total_space"] = format_size(result["saved"])
-                generated_file = generate_html_report(self.report_data, report_path)
-                result["report_path"] = generated_file
-            
-            # Restore original delete_directory function if we replaced it
-            if interactive:
-                import directory_cleaner.directory_cleaner.core.dir_operations as dir_ops
-                dir_ops.delete_directory = original_delete_directory
-            
-            # Restore original print function
-            builtins.print = original_print
-            
-        except Exception as e:
-            result["error"] = str(e)
-            tb = traceback.format_exc()
-            self.log_update.emit(f"Error: {e}\n{tb}")
+                # Restore original delete_directory function if we replaced it
+                if interactive:
+                    import directory_cleaner.directory_cleaner.core.dir_operations as dir_ops
+                    dir_ops.delete_directory = original_delete_directory
+                
+            except Exception as e:
+                result["error"] = str(e)
+                tb = traceback.format_exc()
+                self._enqueue_log(f"Error: {e}\n{tb}")
+        log_stream.flush()
+        size_cache.clear()
+        
+        _pkg_log.removeHandler(log_handler)
+        self._flush_log()
         
         # Signal that the operation is complete
         self.operation_complete.emit(result)
 
+    def submit(self, task, *args, **kwargs):
+        """Queue a task on a persistent worker, starting its thread if needed"""
+        self._tasks.put((task, args, kwargs))
+        if not self.isRunning():
+            self.start()
+    
+    def stop(self):
+        """Stop a persistent worker after its queued tasks have finished"""
+        if self.isRunning():
+            self._tasks.put(None)
+            self.wait()
+    
+    def process_tasks(self):
+        """Run submitted tasks in order until stop() is called"""
+        handlers = {
+            "selected_items": self.delete_selected_items_and_emit
+        }
+        log_handler = _SignalLogHandler(self._enqueue_log)
+        _pkg_log.addHandler(log_handler)
+        try:
+            while True:
+                task = self._tasks.get()
+                if task is None:
+                    break
+                
+                name, args, kwargs = task
+                handler = handlers.get(name)
+                if handler is None:
+                    self.operation_complete.emit({"error": f"Unknown task: {name}"})
+                    continue
+                # As in run(), print output from the cleaning functions (and the
+                # pool threads deleting for them) goes to the log
+                size_cache.clear()
+                log_stream = _LogStream(self._enqueue_log)
+                with contextlib.redirect_stdout(log_stream):
+                    handler(*args, **kwargs)
+                log_stream.flush()
+                size_cache.clear()
+        finally:
+            _pkg_log.removeHandler(log_handler)
+            self._flush_log()
+    
     def set_confirmation_result(self, confirmed):
         """Set the confirmation result and continue processing"""
-        self.interactive_helper.confirmation_result = confirmed
-        self.interactive_helper.wait_for_confirmation.emit("", 0)  # This will unblock the waiting thread
+        self._confirm_result = confirmed
+        self._confirm_event.set()  # This will unblock the waiting thread
 
     def update_progress_percent(self, percent):
         """Update progress as a percentage"""
+        self._last_percent = percent
         self.progress_update.emit(percent)
     
     def increment_progress(self, current, total):
-        """Update progress based on items processed"""
+        """Update progress based on items processed, only when the percentage changes"""
         if total > 0:
-            percent = int((current / total) * 100)
-            self.progress_update.emit(percent)
+            percent = current * 100 // total
+            if percent != self._last_percent:
+                self.update_progress_percent(percent)
     
     def scan_only(self, operation, **kwargs):
         """Scan without deleting and return results for selection"""
         self.progress_update.emit(10)
+        size_cache.clear()
+        
+        # Get directory from kwargs instead of as a positional argument; once it is
+        # normalized, the entry paths scandir joins onto it are normalized too
+        directory = normalize_path(kwargs.get("directory"))
         
-        # Get directory from kwargs instead of as a positional argument
-        directory = kwargs.get("directory")
+        # Filter arguments are the same for every candidate, so look them up once
+        exclude = kwargs.get('exclude')
+        older_than = kwargs.get('older_than')
+        min_size = kwargs.get("min_size")
+        min_size = parse_size(min_size) if min_size else 0
         
         if operation == "node_modules":
-            paths = []
-            # Find all node_modules paths
-            for root, dirs, _ in os.walk(directory, topdown=False):
-                if 'node_modules' in dirs:
-                    node_modules_path = os.path.join(root, 'node_modules')
-                    node_modules_path = normalize_path(node_modules_path)
-                    if should_process(node_modules_path, kwargs.get('exclude'), 
-                                    kwargs.get('older_than'), 
-                                    parse_size(kwargs.get("min_size", "0")) if kwargs.get("min_size") else 0):
-                        size = get_dir_size(node_modules_path)
-                        paths.append((node_modules_path, size, "node_modules"))
+            def is_node_modules(name):
+                return name == 'node_modules'
             
+            # Find all node_modules paths; nested ones go along with their parent
+            paths = [
+                path
+                for name, path, dir_fd in _iter_dirs(directory, recursive=True, prune=is_node_modules)
+                if is_node_modules(name) and should_process(path, exclude, older_than, min_size, dir_fd, normalized=True)
+            ]
+            
+            paths = _with_sizes(paths, "node_modules")
             self.scan_complete.emit(paths)
             return paths
             
         elif operation == "pattern":
             pattern = kwargs.get("pattern")
-            paths = []
             
-            # Find all pattern matches
-            for root, dirs, _ in os.walk(directory, topdown=True):
-                matching_dirs = [d for d in dirs if fnmatch.fnmatch(d, pattern)]
-                for d in matching_dirs:
-                    full_path = os.path.join(root, d)
-                    full_path = normalize_path(full_path)
-                    if should_process(full_path, kwargs.get('exclude'), 
-                                    kwargs.get('older_than'), 
-                                    parse_size(kwargs.get("min_size", "0")) if kwargs.get("min_size") else 0):
-                        size = get_dir_size(full_path)
-                        paths.append((full_path, size, f"pattern:{pattern}"))
-                    
-                    # Avoid descending into directories we've found
-                    dirs.remove(d)
+            def is_match(name):
+                return fnmatch.fnmatch(name, pattern)
+            
+            # Find all pattern matches, avoiding descending into directories we've found
+            paths = [
+                path
+                for name, path, dir_fd in _iter_dirs(directory, recursive=True, prune=is_match)
+                if is_match(name) and should_process(path, exclude, older_than, min_size, dir_fd, normalized=True)
+            ]
             
+            paths = _with_sizes(paths, f"pattern:{pattern}")
             self.scan_complete.emit(paths)
             return paths
             
         elif operation == "subdirs":
-            paths = []
-            
             # Find all immediate subdirectories
-            for item in os.listdir(directory):
-                item_path = os.path.join(directory, item)
-                item_path = normalize_path(item_path)
-                if os.path.isdir(item_path) and should_process(item_path, kwargs.get('exclude'), 
-                                                            kwargs.get('older_than'), 
-                                                            parse_size(kwargs.get("min_size", "0")) if kwargs.get("min_size") else 0):
-                    size = get_dir_size(item_path)
-                    paths.append((item_path, size, "subdir"))
+            paths = [
+                path
+                for name, path, dir_fd in _iter_dirs(directory)
+                if should_process(path, exclude, older_than, min_size, dir_fd, normalized=True)
+            ]
             
+            paths = _with_sizes(paths, "subdir")
             self.scan_complete.emit(paths)
             return paths
             
         elif operation == "empty_dirs":
-            paths = []
-            
-            # Find all empty directories
-            empty_dirs = find_empty_directories(directory, kwargs.get('exclude'))
-            for path in empty_dirs:
-                size = 0  # Empty directories are 0 bytes
-                paths.append((path, size, "empty"))
+            # Find all empty directories; they are 0 bytes
+            empty_dirs = find_empty_directories(directory, exclude)
+            paths = [(path, 0, "empty") for path in empty_dirs]
             
             self.scan_complete.emit(paths)
             return paths
@@ -497,12 +614,12 @@ class WorkerThread(QThread):
             paths = []
             
             # Run the discovery function
+            from directory_cleaner.directory_cleaner.core.analysis import find_cleaning_opportunities
             opportunities = find_cleaning_opportunities(directory)
             
-            # Flatten all opportunities for the selection UI
+            # Flatten all opportunities for the selection UI, a category at a time
             for category, items in opportunities.items():
-                for path, size in items:
-                    paths.append((path, size, category))
+                paths.extend([(path, size, category) for path, size in items])
             
             self.scan_complete.emit(paths)
             return paths
@@ -510,20 +627,30 @@ class WorkerThread(QThread):
         self.progress_update.emit(90)
         return []
 
-    def delete_selected_items(self, items, dry_run=False, trash=False, interactive=False):
+    def delete_selected_items(self, items, dry_run=False, trash=False, interactive=False, parallel=False,
+                              verbose=True):
         """Delete a list of selected items"""
+        # Each interactive deletion waits on a confirmation, so only fan out otherwise
+        if parallel and not interactive and len(items) > 1:
+            return self._delete_items_parallel(items, dry_run, trash, verbose)
+        
         total_size = 0
         count = 0
         deleted_items = []
         
-        for path, size, category in items:
-            self.progress_update.emit(int((count / len(items)) * 100))
+        last_percent = -1
+        for done, (path, size, category) in enumerate(items):
+            # Only signal the GUI when the displayed percentage changes
+            percent = done * 100 // len(items)
+            if percent != last_percent:
+                self.progress_update.emit(percent)
+                last_percent = percent
             
             # Use our custom delete function for interactive mode
             if interactive:
-                result_size = self.custom_delete_directory(path, dry_run, trash, interactive)
+                result_size = self.custom_delete_directory(path, dry_run, trash, interactive, verbose)
             else:
-                result_size = delete_directory(path, dry_run, trash, interactive)
+                result_size = delete_directory(path, dry_run, trash, interactive, verbose)
                 
             if result_size > 0:
                 count += 1
@@ -532,14 +659,63 @@ class WorkerThread(QThread):
         
         return count, total_size, deleted_items
 
+    def _delete_items_parallel(self, items, dry_run, trash, verbose=True):
+        """Delete a list of selected items on a thread pool"""
+        total_size = 0
+        count = 0
+        deleted_items = []
+        status = "Deleted" if not dry_run else "Would delete"
+        
+        # Deleting a directory and something inside it at the same time would race,
+        # so only delete the outermost selected directories; the rest go with them
+        selected = {path for path, size, category in items}
+        paths = [path for path in selected if not _has_ancestor_in(path, selected)]
+        
+        executor = _get_pool()
+        futures = {
+            executor.submit(delete_directory, path, dry_run, trash, False, verbose): path
+            for path in paths
+        }
+        
+        # Results are gathered on this thread, so the totals need no locking
+        last_percent = -1
+        for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            # Only signal the GUI when the displayed percentage changes
+            percent = done * 100 // len(paths)
+            if percent != last_percent:
+                self.progress_update.emit(percent)
+                last_percent = percent
+            
+            path = futures[future]
+            try:
+                result_size = future.result()
+            except Exception as e:
+                self._enqueue_log(f"✗ Failed to delete {path}: {e}")
+                continue
+            
+            if result_size > 0:
+                count += 1
+                total_size += result_size
+                deleted_items.append((path, result_size, status))
+        
+        return count, total_size, deleted_items
+    
     def delete_selected_items_and_emit(self, items, **kwargs):
         """Delete selected items and emit results"""
+        # A persistent worker handles many requests, so start each report afresh
+        self.report_data = {
+            "sections": [],
+            "total_space": "0 B"
+        }
+        
         try:
             count, saved, deleted_items = self.delete_selected_items(
                 items,
                 dry_run=kwargs.get("dry_run", False),
                 trash=kwargs.get("trash", False),
-                interactive=kwargs.get("interactive", False)
+                interactive=kwargs.get("interactive", False),
+                parallel=kwargs.get("parallel", False),
+                verbose=not kwargs.get("summary_only", False)
             )
             
             result = {
@@ -550,24 +726,19 @@ class WorkerThread(QThread):
             # Create report if requested
             report_path = kwargs.get("report_path")
             if report_path:
-                report_items = []
-                for path, size, status in deleted_items:
-                    report_items.append({
-                        "path": path,
-                        "size": format_size(size),
-                        "status": status
-                    })
-                
-                self.report_data["sections"].append({
-                    "title": "Selected Items",
-                    "items": report_items
-                })
+                self.report_data["sections"].append(ReportSection(
+                    "Selected Items",
+                    _report_items(deleted_items, format_size),
+                    len(deleted_items)
+                ))
                 
                 self.report_data["total_space"] = format_size(saved)
                 generated_file = generate_html_report(self.report_data, report_path)
                 result["report_path"] = generated_file
             
+            self._flush_log()
             self.operation_complete.emit(result)
         except Exception as e:
-            self.log_update.emit(f"Error: {e}")
+            self._enqueue_log(f"Error: {e}")
+            self._flush_log()
             self.operation_complete.emit({"error": str(e)})
\ No newline at end of file
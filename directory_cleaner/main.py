@@ -6,7 +6,9 @@ This module serves as the entry point to the application.
 """
 
 import sys
+import logging
 from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QPixmapCache
 
 # Import from the correct package structure
 from directory_cleaner.directory_cleaner.gui.main_window import MainWindow
@@ -14,7 +16,10 @@ from directory_cleaner.directory_cleaner.gui.main_window import MainWindow
 
 def main():
     """Main entry point for the application."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     app = QApplication(sys.argv)
+    # Room (in KB) for pixmaps shared between dialogs, such as the About icon
+    QPixmapCache.setCacheLimit(10240)
     window = MainWindow()
     window.show()
     sys.exit(app.exec_())